@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark for `TemporaryMemory.add`, which measures the average
+cost of appending one message as the memory grows. With the id index
+maintained by the memory, the cost should stay flat rather than grow
+linearly with the memory size.
+
+Usage:
+
+    python benchmarks/memory_add_benchmark.py --max-size 50000
+"""
+import argparse
+import time
+
+from agentscope.memory import TemporaryMemory
+from agentscope.message import Msg
+
+
+def benchmark_add(max_size: int, checkpoints: int, probe: int) -> None:
+    """Fill a memory up to `max_size` messages, and report the average
+    time of adding `probe` messages one by one at each checkpoint."""
+    memory = TemporaryMemory()
+    step = max_size // checkpoints
+
+    print(f"{'memory size':>12} | {'add cost (us/msg)':>18}")
+    print("-" * 33)
+    for _ in range(checkpoints):
+        memory.add(
+            [Msg("user", "hello", role="user") for _ in range(step)],
+        )
+
+        msgs = [Msg("user", "hello", role="user") for _ in range(probe)]
+        start = time.perf_counter()
+        for msg in msgs:
+            memory.add(msg)
+        cost = (time.perf_counter() - start) / probe * 1e6
+
+        print(f"{memory.size():>12} | {cost:>18.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-size", type=int, default=50000)
+    parser.add_argument("--checkpoints", type=int, default=5)
+    parser.add_argument("--probe", type=int, default=1000)
+    args = parser.parse_args()
+
+    benchmark_add(args.max_size, args.checkpoints, args.probe)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark for the `Msg` class, which measures the cost of
+construction, `to_dict`, equality and the memory footprint per message.
+
+Run it on different revisions to compare the implementations:
+
+    python benchmarks/msg_benchmark.py --num 200000
+"""
+import argparse
+import time
+import tracemalloc
+
+from agentscope.message import Msg
+
+
+def _report(name: str, seconds: float, num: int) -> None:
+    """Print the average cost per message."""
+    print(f"{name:>16} | {seconds / num * 1e6:>10.3f} us/msg")
+
+
+def benchmark_msg(num: int) -> None:
+    """Benchmark the `Msg` class with `num` messages."""
+    start = time.perf_counter()
+    msgs = [Msg("user", "hello", role="user") for _ in range(num)]
+    _report("construct (str)", time.perf_counter() - start, num)
+
+    start = time.perf_counter()
+    for _ in range(num):
+        Msg("user", {"text": "hello", "score": 1}, role="user")
+    _report("construct (dict)", time.perf_counter() - start, num)
+
+    start = time.perf_counter()
+    for msg in msgs:
+        msg.to_dict()
+    _report("to_dict", time.perf_counter() - start, num)
+
+    start = time.perf_counter()
+    for msg in msgs:
+        _ = msg == msg  # pylint: disable=R0124
+    _report("eq (same)", time.perf_counter() - start, num)
+
+    others = msgs[1:] + msgs[:1]
+    start = time.perf_counter()
+    for msg, other in zip(msgs, others):
+        _ = msg == other
+    _report("eq (different)", time.perf_counter() - start, num)
+
+    del msgs, others
+    tracemalloc.start()
+    msgs = [Msg("user", "hello", role="user") for _ in range(num)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(msgs) == num
+    print(f"{'memory':>16} | {current / num:>10.1f} bytes/msg")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num", type=int, default=200000)
+    args = parser.parse_args()
+
+    benchmark_msg(args.num)
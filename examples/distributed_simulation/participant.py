@@ -9,6 +9,7 @@ from loguru import logger
 
 from agentscope.message import Msg
 from agentscope.agents import AgentBase
+from agentscope.rpc import batch_call
 
 
 class RandomParticipant(AgentBase):
@@ -137,14 +138,16 @@ class Moderator(AgentBase):
             ]
 
     def reply(self, x: Optional[Union[Msg, Sequence[Msg]]] = None) -> Msg:
-        results = []
         msg = Msg(
             name="moderator",
             role="user",
             content=f"Now give a number between 0 and {self.max_value}.",
         )
-        for p in self.participants:
-            results.append(p(msg))
+        # call the participants on the same server in one request
+        results = batch_call(
+            self.participants,
+            args_list=[(msg,)] * len(self.participants),
+        )
         summ = 0
         for r in results:
             try:
@@ -62,6 +62,7 @@ extra_distribute_requires = [
     "expiringdict",
     "cloudpickle",
     "redis",
+    "msgpack",
 ]
 
 extra_dev_requires = [
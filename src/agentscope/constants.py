@@ -33,6 +33,8 @@ _DEFAULT_CACHE_DIR = str(
 _DEFAULT_CFG_NAME = ".config"
 _DEFAULT_IMAGE_NAME = "image_{}_{}.png"
 _DEFAULT_SQLITE_DB_NAME = "agentscope.db"
+_DEFAULT_EMBEDDING_CACHE_NAME = "embedding_cache.db"
+_DEFAULT_EMBEDDING_CACHE_MAX_SIZE = 1024**3
 
 
 # for model wrapper
@@ -46,6 +48,8 @@ _DEFAULT_TRUSTED_HOST = "mirrors.aliyun.com"
 # for monitor
 _DEFAULT_TABLE_NAME_FOR_CHAT_AND_EMBEDDING = "chat_and_embedding_model_monitor"
 _DEFAULT_TABLE_NAME_FOR_IMAGE = "image_model_monitor"
+_DEFAULT_TABLE_NAME_FOR_LATENCY = "model_latency_monitor"
+_DEFAULT_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
 # for summarization
 _DEFAULT_SUMMARIZATION_PROMPT = """
 TEXT: {}
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""A single-file store for the cached text embeddings."""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    key TEXT PRIMARY KEY,
+    dtype TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+_CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS embedding_cache_last_access
+ON embedding_cache (last_access)
+"""
+
+# The maximum number of variables in a single SQLite statement is 999 for
+# old versions, so the batched lookups are split into chunks
+_SQLITE_BATCH_SIZE = 500
+
+
+class EmbeddingCache:
+    """A key-to-vector store that keeps all the cached embeddings in a
+    single SQLite database, with an in-process LRU layer for the hot
+    entries.
+
+    When the total size of the stored vectors exceeds `max_size`, the least
+    recently accessed entries are evicted from the database.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: Optional[int] = None,
+        max_memory_items: int = 10000,
+    ) -> None:
+        """Initialize the embedding cache.
+
+        Args:
+            path (`str`):
+                The path of the SQLite database file.
+            max_size (`Optional[int]`, defaults to `None`):
+                The maximum number of bytes of the stored vectors. `None`
+                means no limit.
+            max_memory_items (`int`, defaults to `10000`):
+                The maximum number of embeddings kept in the in-process LRU
+                layer. `0` disables it.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.max_memory_items = max_memory_items
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_CREATE_TABLE_SQL)
+        self._conn.execute(_CREATE_INDEX_SQL)
+        self._conn.commit()
+        # The running total of the stored bytes, so that the size limit is
+        # checked without scanning the table on each write
+        self._size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM embedding_cache",
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM embedding_cache",
+            ).fetchone()[0]
+
+    @property
+    def total_size(self) -> int:
+        """The total number of bytes of the stored vectors."""
+        with self._lock:
+            return self._size
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Put the vector into the in-process LRU layer."""
+        if self.max_memory_items <= 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Get the embedding of the key, `None` if it's not cached."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Get the embeddings of the keys in batch.
+
+        Args:
+            keys (`Sequence[str]`):
+                The keys of the embeddings.
+
+        Returns:
+            `List[Optional[np.ndarray]]`: The embeddings in the same order
+            as the keys, where `None` means the key is not cached.
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+        with self._lock:
+            missing: dict[str, List[int]] = {}
+            for i, key in enumerate(keys):
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    results[i] = self._memory[key]
+                else:
+                    missing.setdefault(key, []).append(i)
+
+            if len(missing) == 0:
+                return results
+
+            missing_keys = list(missing.keys())
+            found = []
+            for start in range(0, len(missing_keys), _SQLITE_BATCH_SIZE):
+                chunk = missing_keys[start : start + _SQLITE_BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                found.extend(
+                    self._conn.execute(
+                        f"SELECT key, dtype, vector FROM embedding_cache "
+                        f"WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall(),
+                )
+
+            for key, dtype, blob in found:
+                vector = np.frombuffer(blob, dtype=dtype).copy()
+                self._remember(key, vector)
+                for i in missing[key]:
+                    results[i] = vector
+
+            # Refresh the access time for eviction in a single statement
+            if len(found) > 0:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_access = ? "
+                    "WHERE key = ?",
+                    [(now, _[0]) for _ in found],
+                )
+                self._conn.commit()
+
+        return results
+
+    def put(self, key: str, embedding: Iterable[float]) -> None:
+        """Cache the embedding of the key."""
+        self.put_many([(key, embedding)])
+
+    def put_many(self, items: Sequence[Tuple[str, Iterable[float]]]) -> None:
+        """Cache the embeddings in batch within a single transaction.
+
+        Args:
+            items (`Sequence[Tuple[str, Iterable[float]]]`):
+                The (key, embedding) pairs to cache.
+        """
+        if len(items) == 0:
+            return
+
+        now = time.time()
+        records = {}
+        with self._lock:
+            for key, embedding in items:
+                vector = np.asarray(embedding)
+                if vector.dtype == object:
+                    raise ValueError(
+                        f"The embedding of {key} is not a numeric array.",
+                    )
+                vector = np.ascontiguousarray(vector.reshape(-1))
+                self._remember(key, vector)
+                records[key] = (
+                    key,
+                    vector.dtype.str,
+                    vector.tobytes(),
+                    vector.nbytes,
+                    now,
+                )
+
+            # The replaced entries are subtracted from the running total
+            self._size -= self._sum_sizes(list(records.keys()))
+            self._size += sum(_[3] for _ in records.values())
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(key, dtype, vector, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                list(records.values()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _sum_sizes(self, keys: Sequence[str]) -> int:
+        """The total size of the stored vectors of the given keys."""
+        total = 0
+        for start in range(0, len(keys), _SQLITE_BATCH_SIZE):
+            chunk = keys[start : start + _SQLITE_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            total += self._conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM embedding_cache "
+                f"WHERE key IN ({placeholders})",
+                chunk,
+            ).fetchone()[0]
+        return total
+
+    def _evict(self) -> None:
+        """Evict the least recently accessed entries until the total size
+        fits in the limit."""
+        if self.max_size is None:
+            return
+
+        excess = self._size - self.max_size
+        if excess <= 0:
+            return
+
+        evicted = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM embedding_cache ORDER BY last_access",
+        ):
+            if excess <= 0:
+                break
+            evicted.append(key)
+            excess -= size
+            self._size -= size
+
+        self._conn.executemany(
+            "DELETE FROM embedding_cache WHERE key = ?",
+            [(_,) for _ in evicted],
+        )
+        for key in evicted:
+            self._memory.pop(key, None)
+
+    def delete(self, key: str) -> None:
+        """Remove the embedding of the key from the cache."""
+        with self._lock:
+            self._memory.pop(key, None)
+            self._size -= self._sum_sizes([key])
+            self._conn.execute(
+                "DELETE FROM embedding_cache WHERE key = ?",
+                (key,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all the cached embeddings."""
+        with self._lock:
+            self._memory.clear()
+            self._size = 0
+            self._conn.execute("DELETE FROM embedding_cache")
+            self._conn.commit()
+
+    def migrate_from_dir(
+        self,
+        directory: str,
+        remove: bool = True,
+        batch_size: int = 1000,
+    ) -> int:
+        """Import the embeddings cached as separate `.npy` files, whose
+        names are the keys, into this store.
+
+        Args:
+            directory (`str`):
+                The directory of the `.npy` files.
+            remove (`bool`, defaults to `True`):
+                Whether to remove the `.npy` files after importing.
+            batch_size (`int`, defaults to `1000`):
+                The number of embeddings written in a transaction.
+
+        Returns:
+            `int`: The number of imported embeddings.
+        """
+        if not os.path.isdir(directory):
+            return 0
+
+        n_imported = 0
+        batch: List[Tuple[str, np.ndarray]] = []
+        paths: List[str] = []
+
+        def _write_batch() -> None:
+            self.put_many(batch)
+            if remove:
+                for path in paths:
+                    os.remove(path)
+            batch.clear()
+            paths.clear()
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.endswith(".npy"):
+                    continue
+                try:
+                    embedding = np.load(entry.path)
+                except (OSError, ValueError) as e:
+                    logger.warning(
+                        f"Skip migrating the broken embedding cache "
+                        f"{entry.path}: {e}",
+                    )
+                    continue
+                batch.append((entry.name[: -len(".npy")], embedding))
+                paths.append(entry.path)
+                n_imported += 1
+
+                if len(batch) >= batch_size:
+                    _write_batch()
+
+        _write_batch()
+
+        if n_imported > 0:
+            logger.info(
+                f"Migrated {n_imported} cached embeddings from {directory} "
+                f"into {self.path}.",
+            )
+        return n_imported
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.close()
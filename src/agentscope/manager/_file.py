@@ -4,10 +4,11 @@ import io
 import json
 import os
 import shutil
-from typing import Any, Union, Optional, List, Literal, Generator
+from typing import Any, Union, Optional, List, Literal, Generator, Sequence
 import numpy as np
 from PIL import Image
 
+from ._embedding_cache import EmbeddingCache
 from ..utils.common import (
     _download_file,
     _hash_string,
@@ -20,6 +21,8 @@ from ..constants import (
     _DEFAULT_SUBDIR_INVOKE,
     _DEFAULT_IMAGE_NAME,
     _DEFAULT_CFG_NAME,
+    _DEFAULT_EMBEDDING_CACHE_NAME,
+    _DEFAULT_EMBEDDING_CACHE_MAX_SIZE,
 )
 
 
@@ -89,6 +92,10 @@ class FileManager:
         self.base_dir = None
         self.run_dir = None
 
+        # The maximum number of bytes of the cached embeddings
+        self.embedding_cache_max_size = _DEFAULT_EMBEDDING_CACHE_MAX_SIZE
+        self._embedding_cache: Optional[EmbeddingCache] = None
+
     def initialize(
         self,
         run_dir: Union[str, None],
@@ -145,6 +152,30 @@ class FileManager:
         os.makedirs(dir_cache_embedding, exist_ok=True)
         return dir_cache_embedding
 
+    @property
+    def embedding_cache(self) -> EmbeddingCache:
+        """The store of the cached text embeddings, which is opened on the
+        first access. The embeddings cached as separate `.npy` files by
+        the previous versions are migrated into it at that time."""
+        path = os.path.join(
+            self.embedding_cache_dir,
+            _DEFAULT_EMBEDDING_CACHE_NAME,
+        )
+        if self._embedding_cache is None or self._embedding_cache.path != path:
+            self._close_embedding_cache()
+            self._embedding_cache = EmbeddingCache(
+                path,
+                max_size=self.embedding_cache_max_size,
+            )
+            self._embedding_cache.migrate_from_dir(self.embedding_cache_dir)
+        return self._embedding_cache
+
+    def _close_embedding_cache(self) -> None:
+        """Close the embedding cache if it's opened."""
+        if self._embedding_cache is not None:
+            self._embedding_cache.close()
+            self._embedding_cache = None
+
     @property
     def file_dir(self) -> str:
         """The directory for saving files, including images, audios and
@@ -299,19 +330,33 @@ class FileManager:
         embedding_model: Union[str, dict],
     ) -> None:
         """Cache the text embedding locally."""
-        record_hash = _get_text_embedding_record_hash(
-            text,
-            embedding_model,
-            "sha256",
-        )
+        self.cache_text_embeddings([text], [embedding], embedding_model)
 
-        # Save the embedding to the cache directory
-        np.save(
-            os.path.join(
-                self.embedding_cache_dir,
-                f"{record_hash}.npy",
-            ),
-            embedding,
+    def cache_text_embeddings(
+        self,
+        texts: Sequence[str],
+        embeddings: Sequence[List[float]],
+        embedding_model: Union[str, dict],
+    ) -> None:
+        """Cache the embeddings of a batch of texts locally."""
+        if len(texts) != len(embeddings):
+            raise ValueError(
+                f"The number of texts ({len(texts)}) doesn't match the "
+                f"number of embeddings ({len(embeddings)}).",
+            )
+
+        self.embedding_cache.put_many(
+            [
+                (
+                    _get_text_embedding_record_hash(
+                        text,
+                        embedding_model,
+                        "sha256",
+                    ),
+                    embedding,
+                )
+                for text, embedding in zip(texts, embeddings)
+            ],
         )
 
     def fetch_cached_text_embedding(
@@ -320,21 +365,25 @@ class FileManager:
         embedding_model: Union[str, dict],
     ) -> Union[None, List[float]]:
         """Fetch the text embedding from the cache."""
-        record_hash = _get_text_embedding_record_hash(
-            text,
-            embedding_model,
-            "sha256",
-        )
+        return self.fetch_cached_text_embeddings([text], embedding_model)[0]
 
-        try:
-            return np.load(
-                os.path.join(
-                    self.embedding_cache_dir,
-                    f"{record_hash}.npy",
-                ),
-            )
-        except FileNotFoundError:
-            return None
+    def fetch_cached_text_embeddings(
+        self,
+        texts: Sequence[str],
+        embedding_model: Union[str, dict],
+    ) -> List[Union[None, List[float]]]:
+        """Fetch the embeddings of a batch of texts from the cache, where
+        `None` means the embedding of the text is not cached."""
+        return self.embedding_cache.get_many(
+            [
+                _get_text_embedding_record_hash(
+                    text,
+                    embedding_model,
+                    "sha256",
+                )
+                for text in texts
+            ],
+        )
 
     def state_dict(self) -> dict:
         """Serialize the configuration into a dict."""
@@ -365,3 +414,6 @@ class FileManager:
         self.cache_dir = None
         self.base_dir = None
         self.run_dir = None
+
+        self.embedding_cache_max_size = _DEFAULT_EMBEDDING_CACHE_MAX_SIZE
+        self._close_embedding_cache()
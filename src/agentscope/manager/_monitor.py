@@ -1,11 +1,23 @@
 # -*- coding: utf-8 -*-
 """The manager of monitor module."""
+import atexit
+import contextlib
 import os
-from typing import Any, Optional, List, Union
+import threading
+import time
+from typing import Any, Generator, Optional, List, Union
 from pathlib import Path
 
 from loguru import logger
-from sqlalchemy import Column, Integer, String, create_engine, text
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    String,
+    create_engine,
+    insert,
+    text,
+)
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 from sqlalchemy.orm import sessionmaker
 
@@ -15,6 +27,8 @@ from ..constants import (
     _DEFAULT_SQLITE_DB_NAME,
     _DEFAULT_TABLE_NAME_FOR_CHAT_AND_EMBEDDING,
     _DEFAULT_TABLE_NAME_FOR_IMAGE,
+    _DEFAULT_TABLE_NAME_FOR_LATENCY,
+    _DEFAULT_LATENCY_BUCKETS,
 )
 
 _Base: DeclarativeMeta = declarative_base()
@@ -43,6 +57,75 @@ class _ImageModelTable(_Base):
     image_count = Column(Integer, default=0)
 
 
+class _ModelLatencyTable(_Base):
+    """The table for the latency records of model calls."""
+
+    __tablename__ = _DEFAULT_TABLE_NAME_FOR_LATENCY
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    model_name = Column(String(50))
+    latency = Column(Float, default=0.0)
+    ttft = Column(Float, nullable=True)
+    completion_tokens = Column(Integer, default=0)
+    success = Column(Integer, default=1)
+    retries = Column(Integer, default=0)
+
+
+_call_context = threading.local()
+"""The thread-local context that holds the statistics of the model call
+running in the current thread."""
+
+
+class _ModelCallStats:
+    """The statistics of a single model call, which are collected while the
+    call (and its stream, if any) is running, and recorded into the monitor
+    when the call finishes."""
+
+    def __init__(self, model_name: str) -> None:
+        self.model_name = model_name
+        self.start = time.perf_counter()
+        self.ttft: Optional[float] = None
+        self.completion_tokens = 0
+        self.retries = 0
+        self.finished = False
+
+    @staticmethod
+    def current() -> Optional["_ModelCallStats"]:
+        """The statistics of the model call running in this thread."""
+        return getattr(_call_context, "stats", None)
+
+    @contextlib.contextmanager
+    def activate(self) -> Generator[None, None, None]:
+        """Make this call the current one within the context, so that the
+        token usage and retries reported to the monitor are attributed to
+        it."""
+        previous = getattr(_call_context, "stats", None)
+        _call_context.stats = self
+        try:
+            yield
+        finally:
+            _call_context.stats = previous
+
+    def first_token(self) -> None:
+        """Mark the arrival of the first chunk of a stream."""
+        if self.ttft is None:
+            self.ttft = time.perf_counter() - self.start
+
+    def finish(self, monitor: "MonitorManager", success: bool) -> None:
+        """Record the statistics into the monitor, only once."""
+        if self.finished:
+            return
+        self.finished = True
+        monitor.update_model_latency(
+            model_name=self.model_name,
+            latency=time.perf_counter() - self.start,
+            ttft=self.ttft,
+            completion_tokens=self.completion_tokens,
+            success=success,
+            retries=self.retries,
+        )
+
+
 class MonitorManager:
     """The manager of monitor module."""
 
@@ -78,19 +161,122 @@ class MonitorManager:
         # The name of the views
         self.view_chat_and_embedding = "view_chat_and_embedding"
         self.view_image = "view_image"
+        self.view_latency = "view_model_latency"
+
+        # The usage records buffered in memory, which are written into the
+        # database in batches
+        self.flush_batch_size = 100
+        self.flush_interval = 1.0
+        self._pending_records: dict[type, list[dict]] = {
+            _ModelTable: [],
+            _ImageModelTable: [],
+            _ModelLatencyTable: [],
+        }
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        atexit.register(self.flush_records)
 
-    def initialize(self, use_monitor: bool) -> None:
+    def initialize(
+        self,
+        use_monitor: bool,
+        flush_batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
         """Initialize the monitor manager.
 
         Args:
             use_monitor (`bool`):
                 Whether to use the monitor.
+            flush_batch_size (`int`, defaults to `100`):
+                The number of buffered usage records that triggers writing
+                them into the database.
+            flush_interval (`float`, defaults to `1.0`):
+                The maximum seconds that a usage record stays in the buffer
+                before written into the database.
         """
 
         self.use_monitor = use_monitor
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval = flush_interval
 
         if use_monitor:
             self._create_monitor_db()
+            self._start_flush_thread()
+
+    def _start_flush_thread(self) -> None:
+        """Start the background thread that writes the buffered records
+        into the database by size or interval."""
+        self._stop_flush_thread()
+        self._stop_event.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            name="monitor-flush",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def _stop_flush_thread(self) -> None:
+        """Stop the background flush thread."""
+        if self._flush_thread is not None:
+            self._stop_event.set()
+            self._flush_event.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+
+    def _flush_loop(self) -> None:
+        """Write the buffered records when the buffer is full or the flush
+        interval elapses."""
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            try:
+                self.flush_records()
+            except Exception as e:
+                logger.error(f"Failed to write the monitor records: {e}")
+
+    def _buffer_record(self, table: type, record: dict) -> None:
+        """Buffer a usage record, and wake up the flush thread if the
+        buffer is full."""
+        with self._buffer_lock:
+            self._pending_records[table].append(record)
+            n_pending = sum(len(_) for _ in self._pending_records.values())
+
+        if n_pending >= self.flush_batch_size:
+            self._flush_event.set()
+
+    def flush_records(self) -> None:
+        """Write all the buffered usage records into the database, with one
+        transaction for all of them."""
+        with self._write_lock:
+            with self._buffer_lock:
+                pending = {
+                    table: records
+                    for table, records in self._pending_records.items()
+                    if len(records) > 0
+                }
+                if len(pending) == 0:
+                    return
+                self._pending_records = {
+                    _ModelTable: [],
+                    _ImageModelTable: [],
+                    _ModelLatencyTable: [],
+                }
+
+            if self.session is None:
+                logger.warning(
+                    f"Drop {sum(len(_) for _ in pending.values())} monitor "
+                    f"records since the DB session is closed.",
+                )
+                return
+
+            with self.session() as sess:
+                for table, records in pending.items():
+                    sess.execute(insert(table), records)
+                sess.commit()
 
     @classmethod
     def get_instance(cls) -> "MonitorManager":
@@ -180,11 +366,74 @@ class MonitorManager:
             )
             connection.execute(create_view_sql)
 
+            # Create view for the latency of model calls, where the
+            # percentiles are computed by the nearest-rank method
+            create_view_sql = text(
+                f"""
+                CREATE VIEW IF NOT EXISTS {self.view_latency} AS
+                WITH ranked AS (
+                    SELECT
+                        model_name,
+                        latency,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY model_name ORDER BY latency
+                        ) AS latency_rank,
+                        COUNT(*) OVER (PARTITION BY model_name) AS total
+                    FROM
+                        {_ModelLatencyTable.__tablename__}
+                    WHERE
+                        success = 1
+                ),
+                percentiles AS (
+                    SELECT
+                        model_name,
+                        MIN(CASE WHEN latency_rank >= 0.50 * total
+                            THEN latency END) AS p50_latency,
+                        MIN(CASE WHEN latency_rank >= 0.95 * total
+                            THEN latency END) AS p95_latency,
+                        MIN(CASE WHEN latency_rank >= 0.99 * total
+                            THEN latency END) AS p99_latency
+                    FROM
+                        ranked
+                    GROUP BY
+                        model_name
+                )
+                SELECT
+                    calls.model_name,
+                    COUNT(*) AS times,
+                    SUM(1 - calls.success) AS errors,
+                    SUM(calls.retries) AS retries,
+                    AVG(CASE WHEN calls.success = 1
+                        THEN calls.latency END) AS avg_latency,
+                    MAX(percentiles.p50_latency) AS p50_latency,
+                    MAX(percentiles.p95_latency) AS p95_latency,
+                    MAX(percentiles.p99_latency) AS p99_latency,
+                    AVG(calls.ttft) AS avg_ttft,
+                    SUM(CASE WHEN calls.success = 1
+                        THEN calls.completion_tokens ELSE 0 END) * 1.0
+                    / NULLIF(SUM(CASE WHEN calls.success = 1
+                        THEN calls.latency - COALESCE(calls.ttft, 0)
+                        ELSE 0 END), 0) AS tokens_per_second
+                FROM
+                    {_ModelLatencyTable.__tablename__} AS calls
+                LEFT JOIN
+                    percentiles
+                ON
+                    calls.model_name = percentiles.model_name
+                GROUP BY
+                    calls.model_name;
+                """,
+            )
+            connection.execute(create_view_sql)
+
         self.session = sessionmaker(bind=self.engine)
 
     def _close_monitor_db(self) -> None:
         """Close the monitor database to avoid file occupation error in
         windows."""
+        self._stop_flush_thread()
+        self.flush_records()
+
         if self.session is not None:
             self.session.close_all()
 
@@ -204,15 +453,14 @@ class MonitorManager:
         if self.session is None:
             raise RuntimeError("The DB session in monitor is not initialized.")
 
-        with self.session() as sess:
-            new_record = _ImageModelTable(
-                model_name=model_name,
-                resolution=resolution,
-                image_count=image_count,
-            )
-
-            sess.add(new_record)
-            sess.commit()
+        self._buffer_record(
+            _ImageModelTable,
+            {
+                "model_name": model_name,
+                "resolution": resolution,
+                "image_count": image_count,
+            },
+        )
 
     def update_text_and_embedding_tokens(
         self,
@@ -231,17 +479,70 @@ class MonitorManager:
         if total_tokens is not None:
             assert total_tokens == prompt_tokens + completion_tokens
 
-        with self.session() as sess:
-            new_record = _ModelTable(
-                model_name=model_name,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens
+        stats = _ModelCallStats.current()
+        if stats is not None:
+            stats.completion_tokens += completion_tokens
+
+        self._buffer_record(
+            _ModelTable,
+            {
+                "model_name": model_name,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": total_tokens
                 or (prompt_tokens + completion_tokens),
-            )
+            },
+        )
 
-            sess.add(new_record)
-            sess.commit()
+    def update_model_latency(
+        self,
+        model_name: str,
+        latency: float,
+        ttft: Optional[float] = None,
+        completion_tokens: int = 0,
+        success: bool = True,
+        retries: int = 0,
+    ) -> None:
+        """Record the latency of a model call.
+
+        Args:
+            model_name (`str`):
+                The name of the model.
+            latency (`float`):
+                The seconds from the start of the call to the end of the
+                response (or the end of the stream).
+            ttft (`Optional[float]`, defaults to `None`):
+                The seconds to the first chunk for streaming calls.
+            completion_tokens (`int`, defaults to `0`):
+                The number of the generated tokens.
+            success (`bool`, defaults to `True`):
+                Whether the call succeeded.
+            retries (`int`, defaults to `0`):
+                The number of retries within the call.
+        """
+        if not self.use_monitor:
+            return
+
+        if self.session is None:
+            raise RuntimeError("The DB session in monitor is not initialized.")
+
+        self._buffer_record(
+            _ModelLatencyTable,
+            {
+                "model_name": model_name,
+                "latency": latency,
+                "ttft": ttft,
+                "completion_tokens": completion_tokens,
+                "success": int(success),
+                "retries": retries,
+            },
+        )
+
+    def update_retries(self, retries: int = 1) -> None:
+        """Count the retries of the model call running in this thread."""
+        stats = _ModelCallStats.current()
+        if stats is not None:
+            stats.retries += retries
 
     def print_llm_usage(self) -> dict:
         """Print the usage of all different model APIs."""
@@ -259,6 +560,8 @@ class MonitorManager:
         usage = []
 
         if self.use_monitor:
+            # Write the buffered records to return exact results
+            self.flush_records()
             with self.engine.connect() as connection:
                 usage = connection.execute(
                     text(f"SELECT * FROM {self.view_image}"),
@@ -290,6 +593,8 @@ class MonitorManager:
         usage = []
 
         if self.use_monitor:
+            # Write the buffered records to return exact results
+            self.flush_records()
             with self.engine.connect() as connection:
                 usage = connection.execute(
                     text(f"SELECT * FROM {self.view_chat_and_embedding}"),
@@ -318,6 +623,154 @@ class MonitorManager:
             for _ in usage[1:]
         ]
 
+    def show_model_latency(self) -> List[dict]:
+        """Show the latency and throughput metrics of all models."""
+        usage = []
+
+        if self.use_monitor:
+            # Write the buffered records to return exact results
+            self.flush_records()
+            with self.engine.connect() as connection:
+                usage = connection.execute(
+                    text(f"SELECT * FROM {self.view_latency}"),
+                ).fetchall()
+
+        keys = [
+            "model_name",
+            "times",
+            "errors",
+            "retries",
+            "avg_latency",
+            "p50_latency",
+            "p95_latency",
+            "p99_latency",
+            "avg_ttft",
+            "tokens_per_second",
+        ]
+
+        usage.insert(0, [_.upper().replace("_", " ") for _ in keys])
+
+        self._print_table("Model Latency:", usage)
+
+        return [dict(zip(keys, _)) for _ in usage[1:]]
+
+    def export_prometheus(self) -> str:
+        """Export the metrics of the model calls in Prometheus text format,
+        including the latency and time-to-first-token histograms, the call,
+        error, retry and token counters, and the generation throughput.
+
+        Returns:
+            `str`: The metrics in Prometheus text exposition format.
+        """
+        if not self.use_monitor:
+            return ""
+
+        self.flush_records()
+
+        def _labels(**kwargs: Any) -> str:
+            escaped = [
+                f'{key}="'
+                + str(value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
+                + '"'
+                for key, value in kwargs.items()
+            ]
+            return "{" + ",".join(escaped) + "}"
+
+        lines = []
+        bucket_columns = ", ".join(
+            f"SUM(CASE WHEN {{column}} <= {bound} THEN 1 ELSE 0 END)"
+            for bound in _DEFAULT_LATENCY_BUCKETS
+        )
+
+        with self.engine.connect() as connection:
+            for metric, column, description in [
+                (
+                    "agentscope_model_latency_seconds",
+                    "latency",
+                    "The latency of model calls.",
+                ),
+                (
+                    "agentscope_model_ttft_seconds",
+                    "ttft",
+                    "The time to the first chunk of streaming model calls.",
+                ),
+            ]:
+                rows = connection.execute(
+                    text(
+                        f"SELECT model_name, "
+                        f"{bucket_columns.format(column=column)}, "
+                        f"SUM({column}), COUNT({column}) "
+                        f"FROM {_ModelLatencyTable.__tablename__} "
+                        f"WHERE success = 1 AND {column} IS NOT NULL "
+                        f"GROUP BY model_name",
+                    ),
+                ).fetchall()
+
+                lines.append(f"# HELP {metric} {description}")
+                lines.append(f"# TYPE {metric} histogram")
+                for row in rows:
+                    model_name, counts = row[0], row[1:-2]
+                    for bound, n in zip(_DEFAULT_LATENCY_BUCKETS, counts):
+                        labels = _labels(model_name=model_name, le=bound)
+                        lines.append(f"{metric}_bucket{labels} {n}")
+                    labels = _labels(model_name=model_name, le="+Inf")
+                    lines.append(f"{metric}_bucket{labels} {row[-1]}")
+                    labels = _labels(model_name=model_name)
+                    lines.append(f"{metric}_sum{labels} {row[-2]}")
+                    lines.append(f"{metric}_count{labels} {row[-1]}")
+
+        latency = self.show_model_latency()
+        counters = [
+            (
+                "agentscope_model_calls_total",
+                "counter",
+                "The number of model calls.",
+                "times",
+            ),
+            (
+                "agentscope_model_errors_total",
+                "counter",
+                "The number of failed model calls.",
+                "errors",
+            ),
+            (
+                "agentscope_model_retries_total",
+                "counter",
+                "The number of retries within model calls.",
+                "retries",
+            ),
+            (
+                "agentscope_model_tokens_per_second",
+                "gauge",
+                "The average number of generated tokens per second.",
+                "tokens_per_second",
+            ),
+        ]
+        for metric, metric_type, description, key in counters:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for record in latency:
+                if record[key] is not None:
+                    labels = _labels(model_name=record["model_name"])
+                    lines.append(f"{metric}{labels} {record[key]}")
+
+        metric = "agentscope_model_tokens_total"
+        lines.append(f"# HELP {metric} The number of tokens used by models.")
+        lines.append(f"# TYPE {metric} counter")
+        for record in self.show_text_and_embedding_tokens():
+            for token_type in ["prompt", "completion"]:
+                labels = _labels(
+                    model_name=record["model_name"],
+                    type=token_type,
+                )
+                value = record[f"{token_type}_tokens"]
+                lines.append(f"{metric}{labels} {value}")
+
+        return "\n".join(lines) + "\n"
+
     def rm_database(self) -> None:
         """Remove the database."""
         if self.path_db is not None and os.path.exists(self.path_db):
@@ -348,3 +801,4 @@ class MonitorManager:
         # The name of the views
         self.view_chat_and_embedding = "view_chat_and_embedding"
         self.view_image = "view_image"
+        self.view_latency = "view_model_latency"
@@ -6,8 +6,12 @@ import al memory related modules
 
 from .memory import MemoryBase
 from .temporary_memory import TemporaryMemory
+from .ring_buffer_memory import RingBufferMemory
+from .persistent_memory import PersistentMemory
 
 __all__ = [
     "MemoryBase",
     "TemporaryMemory",
+    "RingBufferMemory",
+    "PersistentMemory",
 ]
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""A contiguous embedding matrix used to vectorize the similarity search
+over the memory units."""
+from typing import Any, Iterable, Literal, Optional, Sequence
+
+import numpy as np
+
+from ..models import ModelResponse
+
+_SUPPORTED_METRICS = ("cos", "dot", "l2")
+
+
+def _to_vector(embedding: Any) -> Optional[np.ndarray]:
+    """Convert an embedding in different formats (a list of numbers, a
+    `ModelResponse`, or a batch with a single embedding) into a 1-D float
+    vector. Return `None` if the embedding is not available."""
+    if isinstance(embedding, ModelResponse):
+        embedding = embedding.embedding
+
+    if embedding is None:
+        return None
+
+    vector = np.asarray(embedding, dtype=np.float32)
+    if vector.ndim == 2 and vector.shape[0] == 1:
+        vector = vector[0]
+
+    if vector.ndim != 1 or vector.size == 0:
+        raise ValueError(
+            f"Expect a 1-D embedding, but got an array with shape "
+            f"{vector.shape}.",
+        )
+    return vector
+
+
+class EmbeddingIndex:
+    """An index that stores the embeddings of memory units row by row in
+    a contiguous matrix, so that the relevance between a query and all
+    memory units can be computed by a single matrix-vector product.
+
+    The rows are aligned with the positions of the memory units. Units
+    without embedding occupy a row that is marked as invalid, and will be
+    skipped in the search.
+    """
+
+    def __init__(self, initial_capacity: int = 64) -> None:
+        """Initialize the embedding index.
+
+        Args:
+            initial_capacity (`int`, defaults to `64`):
+                The number of rows allocated at the beginning. The matrix
+                grows geometrically when it's full.
+        """
+        self._initial_capacity = initial_capacity
+        # normalized embeddings, shape (capacity, dim)
+        self._matrix: Optional[np.ndarray] = None
+        # the norms of the original embeddings, shape (capacity, )
+        self._norms = np.zeros(initial_capacity, dtype=np.float32)
+        # whether the row holds an embedding, shape (capacity, )
+        self._valid = np.zeros(initial_capacity, dtype=bool)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dim(self) -> Optional[int]:
+        """The dimension of the embeddings, `None` if no embedding has been
+        added yet."""
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    def clear(self) -> None:
+        """Remove all rows from the index."""
+        self._matrix = None
+        self._norms = np.zeros(self._initial_capacity, dtype=np.float32)
+        self._valid = np.zeros(self._initial_capacity, dtype=bool)
+        self._size = 0
+
+    def _reserve(self, capacity: int) -> None:
+        """Make sure the index can hold `capacity` rows."""
+        if capacity <= self._valid.shape[0]:
+            return
+        new_capacity = max(capacity, 2 * self._valid.shape[0])
+
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[: self._size] = self._norms[: self._size]
+        self._norms = norms
+
+        valid = np.zeros(new_capacity, dtype=bool)
+        valid[: self._size] = self._valid[: self._size]
+        self._valid = valid
+
+        if self._matrix is not None:
+            matrix = np.zeros((new_capacity, self.dim), dtype=np.float32)
+            matrix[: self._size] = self._matrix[: self._size]
+            self._matrix = matrix
+
+    def _write(self, row: int, vector: Optional[np.ndarray]) -> None:
+        """Write the vector into the given row."""
+        if vector is None:
+            self._valid[row] = False
+            return
+
+        if self._matrix is None:
+            self._matrix = np.zeros(
+                (self._valid.shape[0], vector.shape[0]),
+                dtype=np.float32,
+            )
+        elif vector.shape[0] != self.dim:
+            raise ValueError(
+                f"The dimension of the embedding {vector.shape[0]} doesn't "
+                f"match the dimension of the index {self.dim}.",
+            )
+
+        norm = float(np.linalg.norm(vector))
+        self._matrix[row] = vector / norm if norm > 0 else vector
+        self._norms[row] = norm
+        self._valid[row] = True
+
+    def extend(self, embeddings: Sequence[Any]) -> None:
+        """Append embeddings (or `None` for units without embedding) at the
+        end of the index."""
+        self._reserve(self._size + len(embeddings))
+        for embedding in embeddings:
+            self._write(self._size, _to_vector(embedding))
+            self._size += 1
+
+    def update(self, row: int, embedding: Any) -> None:
+        """Update the embedding in the given row."""
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} is out of range [0, {self._size}).")
+        self._write(row, _to_vector(embedding))
+
+    def is_valid(self, row: int) -> bool:
+        """Whether the given row holds an embedding."""
+        return bool(self._valid[row])
+
+    def delete(self, rows: Iterable[int]) -> None:
+        """Delete the given rows and shift the following rows forward, so
+        that the rows are still aligned with the memory units."""
+        rows = [_ for _ in set(rows) if 0 <= _ < self._size]
+        if len(rows) == 0:
+            return
+
+        keep = np.ones(self._size, dtype=bool)
+        keep[rows] = False
+        new_size = int(keep.sum())
+
+        self._norms[:new_size] = self._norms[: self._size][keep]
+        self._valid[:new_size] = self._valid[: self._size][keep]
+        self._valid[new_size : self._size] = False
+        if self._matrix is not None:
+            self._matrix[:new_size] = self._matrix[: self._size][keep]
+        self._size = new_size
+
+    def search(
+        self,
+        query: Any,
+        metric: Literal["cos", "dot", "l2"] = "cos",
+        top_k: Optional[int] = 1,
+        preserve_order: bool = True,
+    ) -> list[tuple[float, int]]:
+        """Search the most relevant rows for the query.
+
+        Args:
+            query (`Any`):
+                The query embedding.
+            metric (`Literal["cos", "dot", "l2"]`, defaults to `"cos"`):
+                The metric used to compute the relevance. For `"cos"` and
+                `"dot"`, higher score means better match; for `"l2"`, the
+                score is the euclidean distance and lower is better.
+            top_k (`Optional[int]`, defaults to `1`):
+                The number of rows to return, `None` means all valid rows.
+            preserve_order (`bool`, defaults to `True`):
+                Whether to return the rows in their original order, or in
+                the order of relevance.
+
+        Returns:
+            `list[tuple[float, int]]`: A list of (score, row) pairs.
+        """
+        if metric not in _SUPPORTED_METRICS:
+            raise ValueError(
+                f"Unsupported metric {metric}, expect one of "
+                f"{_SUPPORTED_METRICS}.",
+            )
+
+        query = _to_vector(query)
+        if query is None:
+            raise ValueError("The embedding of the query is not available.")
+
+        rows = np.flatnonzero(self._valid[: self._size])
+        if self._matrix is None or rows.size == 0:
+            return []
+        if query.shape[0] != self.dim:
+            raise ValueError(
+                f"The dimension of the query {query.shape[0]} doesn't match "
+                f"the dimension of the index {self.dim}.",
+            )
+
+        # A single matrix-vector product over the normalized embeddings
+        matrix = self._matrix[rows]
+        norms = self._norms[rows]
+        query_norm = float(np.linalg.norm(query))
+        products = matrix @ query
+
+        if metric == "cos":
+            scores = products / query_norm if query_norm > 0 else products
+            ranking = -scores
+        elif metric == "dot":
+            scores = products * norms
+            ranking = -scores
+        else:
+            squared = norms**2 + query_norm**2 - 2 * products * norms
+            scores = np.sqrt(np.maximum(squared, 0))
+            ranking = scores
+
+        # Select the top-k candidates without sorting all the scores
+        if top_k is not None and top_k < rows.size:
+            candidates = np.argpartition(ranking, max(top_k, 0))[:top_k]
+        else:
+            candidates = np.arange(rows.size)
+
+        if preserve_order:
+            candidates = np.sort(candidates)
+        else:
+            candidates = candidates[np.argsort(ranking[candidates])]
+
+        return [(float(scores[_]), int(rows[_])) for _ in candidates]
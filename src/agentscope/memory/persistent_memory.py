@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+"""
+Memory module that persists messages on disk in an append-only segmented
+log, so that checkpointing an agent only writes the new messages.
+"""
+
+import json
+import mmap
+import os
+import shutil
+from typing import Iterable, NamedTuple, Sequence
+from typing import Optional
+from typing import Union
+from typing import Callable
+
+from loguru import logger
+
+from .memory import MemoryBase
+from ..serialize import serialize, deserialize
+from ..message import Msg
+from ..rpc import AsyncResult
+
+_SEGMENT_PREFIX = "segment_"
+_SEGMENT_SUFFIX = ".log"
+_TOMBSTONE_KEY = "__tombstone__"
+
+
+class _Record(NamedTuple):
+    """The location of a message record in the log."""
+
+    segment: int
+    offset: int
+    length: int
+    msg_id: str
+
+
+class PersistentMemory(MemoryBase):
+    """
+    Disk-backed memory module. Each message is appended to the active
+    segment file as one serialized record per line, and an in-memory offset
+    index locates the records, which are read back through memory-mapped
+    files. Deletions are appended as tombstone records, and the log is
+    compacted once the deleted records take up a large part of it.
+    """
+
+    def __init__(
+        self,
+        log_dir: str,
+        segment_size: int = 64 * 1024 * 1024,
+        compact_ratio: float = 0.5,
+        sync: bool = False,
+    ) -> None:
+        """
+        Persistent memory module for conversation. If `log_dir` already
+        contains a log, the memory is recovered from it.
+
+        Args:
+            log_dir (`str`):
+                The directory to store the segment files.
+            segment_size (`int`, defaults to `64MB`):
+                The size in bytes after which the active segment is sealed
+                and a new one is started.
+            compact_ratio (`float`, defaults to `0.5`):
+                Compact the log after deletion when the ratio of the bytes
+                of deleted records (including tombstones) to the total bytes
+                exceeds this value.
+            sync (`bool`, defaults to `False`):
+                Whether to `fsync` the active segment after each `add`.
+        """
+        super().__init__()
+
+        self.log_dir = os.path.abspath(log_dir)
+        self.segment_size = segment_size
+        self.compact_ratio = compact_ratio
+        self.sync = sync
+
+        os.makedirs(self.log_dir, exist_ok=True)
+
+        self._index: list[_Record] = []
+        self._ids: set[str] = set()
+        self._total_bytes = 0
+        self._dead_bytes = 0
+        self._active_segment = 0
+        self._writer = None
+        # segment number -> (mapped size, mmap object)
+        self._mmaps: dict[int, tuple[int, mmap.mmap]] = {}
+
+        self._recover()
+
+    def _segment_path(self, segment: int) -> str:
+        """The path of the given segment file."""
+        return os.path.join(
+            self.log_dir,
+            f"{_SEGMENT_PREFIX}{segment:08d}{_SEGMENT_SUFFIX}",
+        )
+
+    def _list_segments(self) -> list[int]:
+        """The numbers of the existing segment files in order."""
+        segments = []
+        for filename in os.listdir(self.log_dir):
+            if filename.startswith(_SEGMENT_PREFIX) and filename.endswith(
+                _SEGMENT_SUFFIX,
+            ):
+                segments.append(
+                    int(
+                        filename[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]
+                    ),
+                )
+        return sorted(segments)
+
+    def _recover(self) -> None:
+        """Rebuild the offset index by scanning the existing segments."""
+        positions: dict[str, int] = {}
+        records: list[Optional[_Record]] = []
+        for segment in self._list_segments():
+            offset = 0
+            with open(self._segment_path(segment), "rb") as f:
+                for line in f:
+                    length = len(line)
+                    self._total_bytes += length
+                    data = json.loads(line)
+                    if isinstance(data, dict) and _TOMBSTONE_KEY in data:
+                        msg_id = data[_TOMBSTONE_KEY]
+                        if msg_id in positions:
+                            position = positions.pop(msg_id)
+                            self._dead_bytes += records[position].length
+                            records[position] = None
+                        self._dead_bytes += length
+                    else:
+                        positions[data["id"]] = len(records)
+                        records.append(
+                            _Record(segment, offset, length, data["id"]),
+                        )
+                    offset += length
+            self._active_segment = segment
+
+        self._index = [_ for _ in records if _ is not None]
+        self._ids = {_.msg_id for _ in self._index}
+
+    def _append(self, lines: list[bytes]) -> list[tuple[int, int, int]]:
+        """Append the lines to the active segment, and return their
+        (segment, offset, length)."""
+        locations = []
+        for line in lines:
+            if self._writer is None:
+                self._writer = open(  # pylint: disable=R1732
+                    self._segment_path(self._active_segment),
+                    "ab",
+                )
+            offset = self._writer.tell()
+            if offset > 0 and offset + len(line) > self.segment_size:
+                # Seal the active segment and start a new one
+                self._writer.close()
+                self._active_segment += 1
+                self._writer = open(  # pylint: disable=R1732
+                    self._segment_path(self._active_segment),
+                    "ab",
+                )
+                offset = 0
+            self._writer.write(line)
+            locations.append((self._active_segment, offset, len(line)))
+            self._total_bytes += len(line)
+
+        if self._writer is not None:
+            self._writer.flush()
+            if self.sync:
+                os.fsync(self._writer.fileno())
+        return locations
+
+    def _read(self, record: _Record) -> Msg:
+        """Read a message from the log through the memory-mapped segment."""
+        end = record.offset + record.length
+        mapped = self._mmaps.get(record.segment)
+        if mapped is None or mapped[0] < end:
+            # Map the segment again if it has grown since last mapping
+            if mapped is not None:
+                mapped[1].close()
+            with open(self._segment_path(record.segment), "rb") as f:
+                mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            mapped = (len(mapped_file), mapped_file)
+            self._mmaps[record.segment] = mapped
+
+        return deserialize(mapped[1][record.offset : end].decode("utf-8"))
+
+    def add(
+        self,
+        memories: Union[Sequence[Msg], Msg, None],
+    ) -> None:
+        """
+        Adding new memory fragment, which are appended to the log.
+        Args:
+            memories (`Union[Sequence[Msg], Msg, None]`):
+                Memories to be added.
+        """
+        if memories is None:
+            return
+
+        if not isinstance(memories, Sequence):
+            record_memories = [memories]
+        else:
+            record_memories = memories
+
+        new_units = []
+        for memory_unit in record_memories:
+            # in case this is a PlaceholderMessage, try to update
+            # the values first
+            if isinstance(memory_unit, AsyncResult):
+                memory_unit = memory_unit.result()
+
+            if not isinstance(memory_unit, Msg):
+                raise ValueError(
+                    f"Cannot add {type(memory_unit)} to memory, "
+                    f"must be a Msg object.",
+                )
+
+            # Add to memory if it's new
+            if memory_unit.id not in self._ids:
+                self._ids.add(memory_unit.id)
+                new_units.append(memory_unit)
+
+        lines = [(serialize(_) + "\n").encode("utf-8") for _ in new_units]
+        for memory_unit, location in zip(new_units, self._append(lines)):
+            self._index.append(_Record(*location, memory_unit.id))
+
+    def delete(self, index: Union[Iterable, int]) -> None:
+        """
+        Delete memory fragment by appending tombstone records, and compact
+        the log if needed.
+        Args:
+            index (Union[Iterable, int]):
+                indices of the memory fragments to delete
+        """
+        if self.size() == 0:
+            logger.warning(
+                "The memory is empty, and the delete operation is "
+                "skipping.",
+            )
+            return
+
+        if isinstance(index, int):
+            index = [index]
+
+        if isinstance(index, list):
+            index = set(index)
+
+            invalid_index = [_ for _ in index if _ >= self.size() or _ < 0]
+            if len(invalid_index) > 0:
+                logger.warning(
+                    f"Skip delete operation for the invalid "
+                    f"index {invalid_index}",
+                )
+
+            deleted = [_ for i, _ in enumerate(self._index) if i in index]
+            lines = [
+                (json.dumps({_TOMBSTONE_KEY: _.msg_id}) + "\n").encode(
+                    "utf-8",
+                )
+                for _ in deleted
+            ]
+            self._append(lines)
+            self._dead_bytes += sum(_.length for _ in deleted)
+            self._dead_bytes += sum(len(_) for _ in lines)
+
+            self._index = [
+                _ for i, _ in enumerate(self._index) if i not in index
+            ]
+            self._ids.difference_update(_.msg_id for _ in deleted)
+
+            if self._dead_bytes > self.compact_ratio * self._total_bytes:
+                self.compact()
+        else:
+            raise NotImplementedError(
+                "index type only supports {None, int, list}",
+            )
+
+    def compact(self) -> None:
+        """Rewrite the live records into new segments and drop the deleted
+        records and tombstones. The new segments are written into a
+        temporary directory first, and replace the old ones only after
+        they are completely written."""
+        self._close_files()
+
+        tmp_dir = self.log_dir + ".compact"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        new_index = []
+        segment, offset, writer = 0, 0, None
+        handles: dict[int, object] = {}
+        try:
+            for record in self._index:
+                if record.segment not in handles:
+                    handles[record.segment] = open(  # pylint: disable=R1732
+                        self._segment_path(record.segment),
+                        "rb",
+                    )
+                reader = handles[record.segment]
+                reader.seek(record.offset)
+                line = reader.read(record.length)
+
+                if writer is None or (
+                    offset > 0 and offset + len(line) > self.segment_size
+                ):
+                    if writer is not None:
+                        writer.close()
+                        segment += 1
+                    writer = open(  # pylint: disable=R1732
+                        os.path.join(
+                            tmp_dir,
+                            os.path.basename(self._segment_path(segment)),
+                        ),
+                        "wb",
+                    )
+                    offset = 0
+                writer.write(line)
+                new_index.append(
+                    _Record(segment, offset, len(line), record.msg_id),
+                )
+                offset += len(line)
+        finally:
+            for handle in handles.values():
+                handle.close()
+            if writer is not None:
+                writer.close()
+
+        shutil.rmtree(self.log_dir)
+        os.rename(tmp_dir, self.log_dir)
+
+        self._index = new_index
+        self._active_segment = segment
+        self._total_bytes = sum(_.length for _ in new_index)
+        self._dead_bytes = 0
+
+    def export(
+        self,
+        file_path: Optional[str] = None,
+        to_mem: bool = False,
+    ) -> Optional[list]:
+        """
+        Export memory, depending on how the memory are stored
+        Args:
+            file_path (Optional[str]):
+                file path to save the memory to. The messages will
+                be serialized and written to the file.
+            to_mem (Optional[str]):
+                if True, just return the list of messages in memory
+        Notice: this method prevents file_path is None when to_mem
+        is False.
+        """
+        if to_mem:
+            return self.get_memory()
+
+        if to_mem is False and file_path is not None:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(serialize(self.get_memory()))
+        else:
+            raise NotImplementedError(
+                "file type only supports "
+                "{json, yaml, pkl}, default is json",
+            )
+        return None
+
+    def load(
+        self,
+        memories: Union[str, list[Msg], Msg],
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Load memory, depending on how the memory are passed, design to load
+        from both file or dict
+        Args:
+            memories (Union[str, list[Msg], Msg]):
+                memories to be loaded.
+                If it is in str type, it will be first checked if it is a
+                file; otherwise it will be deserialized as messages.
+                Otherwise, memories must be either in message type or list
+                 of messages.
+            overwrite (bool):
+                if True, clear the current memory before loading the new ones;
+                if False, memories will be appended to the old one at the end.
+        """
+        if isinstance(memories, str):
+            if os.path.isfile(memories):
+                with open(memories, "r", encoding="utf-8") as f:
+                    load_memories = deserialize(f.read())
+            else:
+                try:
+                    load_memories = deserialize(memories)
+                except json.JSONDecodeError as e:
+                    raise json.JSONDecodeError(
+                        f"Cannot load [{memories}] via " f"json.loads.",
+                        e.doc,
+                        e.pos,
+                    )
+        elif isinstance(memories, list):
+            for unit in memories:
+                if not isinstance(unit, Msg):
+                    raise TypeError(
+                        f"Expect a list of Msg objects, but get {type(unit)} "
+                        f"instead.",
+                    )
+            load_memories = memories
+        elif isinstance(memories, Msg):
+            load_memories = [memories]
+        else:
+            raise TypeError(
+                f"The type of memories to be loaded is not supported. "
+                f"Expect str, list[Msg], or Msg, but get {type(memories)}.",
+            )
+
+        # overwrite the original memories after loading the new ones
+        if overwrite:
+            self.clear()
+
+        self.add(load_memories)
+
+    def _close_files(self) -> None:
+        """Close the writer and the memory-mapped segments."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for _, mapped_file in self._mmaps.values():
+            mapped_file.close()
+        self._mmaps = {}
+
+    def close(self) -> None:
+        """Close the opened files. The memory can still be used after
+        closing, and the files will be opened again when needed."""
+        self._close_files()
+
+    def clear(self) -> None:
+        """Clean memory and remove all segment files."""
+        self._close_files()
+        for segment in self._list_segments():
+            os.remove(self._segment_path(segment))
+
+        self._index = []
+        self._ids = set()
+        self._total_bytes = 0
+        self._dead_bytes = 0
+        self._active_segment = 0
+
+    def size(self) -> int:
+        """Returns the number of memory segments in memory."""
+        return len(self._index)
+
+    def get_memory(
+        self,
+        recent_n: Optional[int] = None,
+        filter_func: Optional[Callable[[int, dict], bool]] = None,
+    ) -> list:
+        """Retrieve memory. Only the records of the requested range are
+        read from the disk.
+
+        Args:
+            recent_n (`Optional[int]`, default `None`):
+                The last number of memories to return.
+            filter_func
+                (`Callable[[int, dict], bool]`, default to `None`):
+                The function to filter memories, which take the index and
+                memory unit as input, and return a boolean value.
+        """
+        if recent_n is None:
+            records = self._index
+        else:
+            if recent_n > self.size():
+                logger.warning(
+                    "The retrieved number of memories {} is "
+                    "greater than the total number of memories {"
+                    "}",
+                    recent_n,
+                    self.size(),
+                )
+            records = self._index[-recent_n:]
+
+        memories = [self._read(_) for _ in records]
+
+        # filter the memories
+        if filter_func is not None:
+            memories = [_ for i, _ in enumerate(memories) if filter_func(i, _)]
+
+        return memories
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""
+Memory module with bounded footprint, which only keeps the most recent
+messages in a fixed-capacity ring buffer.
+"""
+
+import json
+import os
+from typing import Iterable, Sequence
+from typing import Optional
+from typing import Union
+from typing import Callable
+
+from loguru import logger
+
+from .memory import MemoryBase
+from ..serialize import serialize, deserialize
+from ..message import Msg
+from ..rpc import AsyncResult
+from ..tokens import count
+from ..utils.common import _convert_to_str
+
+
+class RingBufferMemory(MemoryBase):
+    """
+    In-memory memory module with a fixed capacity. When the memory is full,
+    or the total number of tokens exceeds the token budget, the oldest
+    messages are evicted, and optionally appended to a spill file on disk.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        max_tokens: Optional[int] = None,
+        token_counting_model: Optional[str] = None,
+        spill_file: Optional[str] = None,
+    ) -> None:
+        """
+        Ring buffer memory module for conversation.
+
+        Args:
+            capacity (`int`, defaults to `1000`):
+                The maximum number of messages kept in memory.
+            max_tokens (`Optional[int]`, defaults to `None`):
+                The token budget of the messages kept in memory. If given,
+                the oldest messages are evicted until the total number of
+                tokens fits in the budget. The most recent message is always
+                kept even if it exceeds the budget alone.
+            token_counting_model (`Optional[str]`, defaults to `None`):
+                The model name used to count tokens by
+                `agentscope.tokens.count`, required if `max_tokens` is given.
+            spill_file (`Optional[str]`, defaults to `None`):
+                If given, the evicted messages will be appended to this file,
+                one serialized message per line. They can be read back by
+                `get_spilled_memory`.
+        """
+        super().__init__()
+
+        if capacity < 1:
+            raise ValueError(
+                f"The capacity must be positive, but got {capacity}.",
+            )
+
+        if max_tokens is not None and token_counting_model is None:
+            raise ValueError(
+                "The token_counting_model is required to count tokens when "
+                "max_tokens is given.",
+            )
+
+        self.capacity = capacity
+        self.max_tokens = max_tokens
+        self.token_counting_model = token_counting_model
+        self.spill_file = spill_file
+
+        # the fixed-capacity buffer, where the oldest message is located at
+        # `self._head` and the following messages wrap around the end
+        self._buffer: list[Optional[Msg]] = [None] * capacity
+        self._tokens: list[int] = [0] * capacity
+        self._head = 0
+        self._size = 0
+        self._total_tokens = 0
+        self._ids: set[str] = set()
+
+    @property
+    def total_tokens(self) -> int:
+        """The total number of tokens of the messages in memory, which is
+        always 0 if the token budget is not set."""
+        return self._total_tokens
+
+    def _count_tokens(self, memory_unit: Msg) -> int:
+        """Count the tokens of a message if the token budget is set."""
+        if self.max_tokens is None:
+            return 0
+        return count(
+            self.token_counting_model,
+            [
+                {
+                    "role": memory_unit.role,
+                    "name": memory_unit.name,
+                    "content": _convert_to_str(memory_unit.content),
+                },
+            ],
+        )
+
+    def _iter_positions(self) -> Iterable[int]:
+        """Iterate the buffer positions from the oldest to the newest."""
+        for offset in range(self._size):
+            yield (self._head + offset) % self.capacity
+
+    def _evict(self) -> None:
+        """Evict the oldest message, and spill it to disk if needed."""
+        memory_unit = self._buffer[self._head]
+        self._total_tokens -= self._tokens[self._head]
+        self._buffer[self._head] = None
+        self._tokens[self._head] = 0
+        self._head = (self._head + 1) % self.capacity
+        self._size -= 1
+        self._ids.discard(memory_unit.id)
+
+        if self.spill_file is not None:
+            with open(self.spill_file, "a", encoding="utf-8") as f:
+                f.write(serialize(memory_unit) + "\n")
+
+    def add(
+        self,
+        memories: Union[Sequence[Msg], Msg, None],
+    ) -> None:
+        """
+        Adding new memory fragment, the oldest messages will be evicted if
+        the capacity or the token budget is exceeded.
+        Args:
+            memories (`Union[Sequence[Msg], Msg, None]`):
+                Memories to be added.
+        """
+        if memories is None:
+            return
+
+        if not isinstance(memories, Sequence):
+            record_memories = [memories]
+        else:
+            record_memories = memories
+
+        for memory_unit in record_memories:
+            # in case this is a PlaceholderMessage, try to update
+            # the values first
+            if isinstance(memory_unit, AsyncResult):
+                memory_unit = memory_unit.result()
+
+            if not isinstance(memory_unit, Msg):
+                raise ValueError(
+                    f"Cannot add {type(memory_unit)} to memory, "
+                    f"must be a Msg object.",
+                )
+
+            # Add to memory if it's new
+            if memory_unit.id in self._ids:
+                continue
+
+            if self._size == self.capacity:
+                self._evict()
+
+            position = (self._head + self._size) % self.capacity
+            n_tokens = self._count_tokens(memory_unit)
+            self._buffer[position] = memory_unit
+            self._tokens[position] = n_tokens
+            self._size += 1
+            self._total_tokens += n_tokens
+            self._ids.add(memory_unit.id)
+
+            if self.max_tokens is not None:
+                while self._size > 1 and self._total_tokens > self.max_tokens:
+                    self._evict()
+
+    def delete(self, index: Union[Iterable, int]) -> None:
+        """
+        Delete memory fragment, depending on how the memory are stored
+        and matched
+        Args:
+            index (Union[Iterable, int]):
+                indices of the memory fragments to delete
+        """
+        if self.size() == 0:
+            logger.warning(
+                "The memory is empty, and the delete operation is "
+                "skipping.",
+            )
+            return
+
+        if isinstance(index, int):
+            index = [index]
+
+        if isinstance(index, list):
+            index = set(index)
+
+            invalid_index = [_ for _ in index if _ >= self.size() or _ < 0]
+            if len(invalid_index) > 0:
+                logger.warning(
+                    f"Skip delete operation for the invalid "
+                    f"index {invalid_index}",
+                )
+
+            kept = [
+                (self._buffer[position], self._tokens[position])
+                for i, position in enumerate(self._iter_positions())
+                if i not in index
+            ]
+            self._reset()
+            for memory_unit, n_tokens in kept:
+                self._buffer[self._size] = memory_unit
+                self._tokens[self._size] = n_tokens
+                self._size += 1
+                self._total_tokens += n_tokens
+                self._ids.add(memory_unit.id)
+        else:
+            raise NotImplementedError(
+                "index type only supports {None, int, list}",
+            )
+
+    def export(
+        self,
+        file_path: Optional[str] = None,
+        to_mem: bool = False,
+    ) -> Optional[list]:
+        """
+        Export memory, depending on how the memory are stored
+        Args:
+            file_path (Optional[str]):
+                file path to save the memory to. The messages will
+                be serialized and written to the file.
+            to_mem (Optional[str]):
+                if True, just return the list of messages in memory
+        Notice: this method prevents file_path is None when to_mem
+        is False.
+        """
+        if to_mem:
+            return self.get_memory()
+
+        if to_mem is False and file_path is not None:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(serialize(self.get_memory()))
+        else:
+            raise NotImplementedError(
+                "file type only supports "
+                "{json, yaml, pkl}, default is json",
+            )
+        return None
+
+    def load(
+        self,
+        memories: Union[str, list[Msg], Msg],
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Load memory, depending on how the memory are passed, design to load
+        from both file or dict
+        Args:
+            memories (Union[str, list[Msg], Msg]):
+                memories to be loaded.
+                If it is in str type, it will be first checked if it is a
+                file; otherwise it will be deserialized as messages.
+                Otherwise, memories must be either in message type or list
+                 of messages.
+            overwrite (bool):
+                if True, clear the current memory before loading the new ones;
+                if False, memories will be appended to the old one at the end.
+        """
+        if isinstance(memories, str):
+            if os.path.isfile(memories):
+                with open(memories, "r", encoding="utf-8") as f:
+                    load_memories = deserialize(f.read())
+            else:
+                try:
+                    load_memories = deserialize(memories)
+                except json.JSONDecodeError as e:
+                    raise json.JSONDecodeError(
+                        f"Cannot load [{memories}] via " f"json.loads.",
+                        e.doc,
+                        e.pos,
+                    )
+        elif isinstance(memories, list):
+            for unit in memories:
+                if not isinstance(unit, Msg):
+                    raise TypeError(
+                        f"Expect a list of Msg objects, but get {type(unit)} "
+                        f"instead.",
+                    )
+            load_memories = memories
+        elif isinstance(memories, Msg):
+            load_memories = [memories]
+        else:
+            raise TypeError(
+                f"The type of memories to be loaded is not supported. "
+                f"Expect str, list[Msg], or Msg, but get {type(memories)}.",
+            )
+
+        # overwrite the original memories after loading the new ones
+        if overwrite:
+            self.clear()
+
+        self.add(load_memories)
+
+    def _reset(self) -> None:
+        """Empty the buffer without touching the spill file."""
+        self._buffer = [None] * self.capacity
+        self._tokens = [0] * self.capacity
+        self._head = 0
+        self._size = 0
+        self._total_tokens = 0
+        self._ids = set()
+
+    def clear(self) -> None:
+        """Clean memory, the messages are dropped rather than spilled to
+        the disk."""
+        self._reset()
+
+    def size(self) -> int:
+        """Returns the number of memory segments in memory."""
+        return self._size
+
+    def get_memory(
+        self,
+        recent_n: Optional[int] = None,
+        filter_func: Optional[Callable[[int, dict], bool]] = None,
+    ) -> list:
+        """Retrieve memory.
+
+        Args:
+            recent_n (`Optional[int]`, default `None`):
+                The last number of memories to return.
+            filter_func
+                (`Callable[[int, dict], bool]`, default to `None`):
+                The function to filter memories, which take the index and
+                memory unit as input, and return a boolean value.
+        """
+        if recent_n is None:
+            recent_n = self._size
+        elif recent_n > self._size:
+            logger.warning(
+                "The retrieved number of memories {} is "
+                "greater than the total number of memories {"
+                "}",
+                recent_n,
+                self._size,
+            )
+            recent_n = self._size
+
+        # Only copy the requested range out of the ring buffer
+        start = self._head + self._size - recent_n
+        memories = [
+            self._buffer[(start + offset) % self.capacity]
+            for offset in range(recent_n)
+        ]
+
+        # filter the memories
+        if filter_func is not None:
+            memories = [_ for i, _ in enumerate(memories) if filter_func(i, _)]
+
+        return memories
+
+    def get_spilled_memory(self) -> list[Msg]:
+        """Read the evicted messages back from the spill file, from the
+        oldest to the newest.
+
+        Returns:
+            `list[Msg]`: The evicted messages, empty if no spill file is
+            set or nothing has been evicted.
+        """
+        if self.spill_file is None or not os.path.isfile(self.spill_file):
+            return []
+
+        with open(self.spill_file, "r", encoding="utf-8") as f:
+            return [deserialize(line) for line in f if line.strip()]
@@ -5,20 +5,25 @@ Memory module for conversation
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Sequence
 from typing import Optional
 from typing import Union
 from typing import Callable
+from typing import Literal
+from typing import Any
 
 from loguru import logger
 
 from .memory import MemoryBase
+from ._embedding_index import EmbeddingIndex
 from ..manager import ModelManager
 from ..serialize import serialize, deserialize
 from ..service.retrieval.retrieval_from_list import retrieve_from_list
 from ..service.retrieval.similarity import Embedding
 from ..message import Msg
 from ..rpc import AsyncResult
+from ..utils.common import _convert_to_str
 
 
 class TemporaryMemory(MemoryBase):
@@ -29,6 +34,8 @@ class TemporaryMemory(MemoryBase):
     def __init__(
         self,
         embedding_model: Union[str, Callable] = None,
+        embedding_batch_size: int = 32,
+        embedding_workers: int = 1,
     ) -> None:
         """
         Temporary memory module for conversation.
@@ -38,10 +45,30 @@ class TemporaryMemory(MemoryBase):
                 if the temporary memory needs to be embedded,
                 then either pass the name of embedding model or
                 the embedding model itself.
+            embedding_batch_size (`int`, defaults to `32`):
+                The maximum number of memory units embedded in a single call
+                of the embedding model.
+            embedding_workers (`int`, defaults to `1`):
+                The number of threads used to embed different batches
+                concurrently. Batches are embedded sequentially if it's 1.
         """
         super().__init__()
 
+        if embedding_batch_size < 1:
+            raise ValueError(
+                f"embedding_batch_size must be positive, but got "
+                f"{embedding_batch_size}.",
+            )
+
         self._content = []
+        # the positions of the memory units in `self._content` by their ids,
+        # used to detect duplicate units in O(1)
+        self._id_to_index: dict[str, int] = {}
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_workers = embedding_workers
+
+        # the embeddings of the memory units, aligned with `self._content`
+        self._embedding_index = EmbeddingIndex()
 
         # prepare embedding model if needed
         if isinstance(embedding_model, str):
@@ -73,9 +100,11 @@ class TemporaryMemory(MemoryBase):
         else:
             record_memories = memories
 
-        # FIXME: a single message may be inserted multiple times
+        if embed and not self.embedding_model:
+            raise RuntimeError("Embedding model is not provided.")
+
         # Assert the message types
-        memories_idx = set(_.id for _ in self._content if hasattr(_, "id"))
+        new_units = []
         for memory_unit in record_memories:
             # in case this is a PlaceholderMessage, try to update
             # the values first
@@ -89,17 +118,19 @@ class TemporaryMemory(MemoryBase):
                 )
 
             # Add to memory if it's new
-            if memory_unit.id not in memories_idx:
-                if embed:
-                    if self.embedding_model:
-                        # TODO: embed only content or its string representation
-                        memory_unit.embedding = self.embedding_model(
-                            [memory_unit],
-                            return_embedding_only=True,
-                        )
-                    else:
-                        raise RuntimeError("Embedding model is not provided.")
+            if memory_unit.id not in self._id_to_index:
+                self._id_to_index[memory_unit.id] = len(self._content)
                 self._content.append(memory_unit)
+                self._embedding_index.extend(
+                    [getattr(memory_unit, "embedding", None)],
+                )
+                new_units.append(memory_unit)
+
+        if embed:
+            self._embed_units(
+                len(self._content) - len(new_units),
+                self.embedding_model,
+            )
 
     def delete(self, index: Union[Iterable, int]) -> None:
         """
@@ -132,6 +163,8 @@ class TemporaryMemory(MemoryBase):
             self._content = [
                 _ for i, _ in enumerate(self._content) if i not in index
             ]
+            self._id_to_index = {_.id: i for i, _ in enumerate(self._content)}
+            self._embedding_index.delete(index)
         else:
             raise NotImplementedError(
                 "index type only supports {None, int, list}",
@@ -232,6 +265,8 @@ class TemporaryMemory(MemoryBase):
     def clear(self) -> None:
         """Clean memory, depending on how the memory are stored"""
         self._content = []
+        self._id_to_index = {}
+        self._embedding_index.clear()
 
     def size(self) -> int:
         """Returns the number of memory segments in memory."""
@@ -240,7 +275,10 @@ class TemporaryMemory(MemoryBase):
     def retrieve_by_embedding(
         self,
         query: Union[str, Embedding],
-        metric: Callable[[Embedding, Embedding], float],
+        metric: Union[
+            Literal["cos", "dot", "l2"],
+            Callable[[Embedding, Embedding], float],
+        ],
         top_k: int = 1,
         preserve_order: bool = True,
         embedding_model: Callable[[Union[str, dict]], Embedding] = None,
@@ -250,10 +288,16 @@ class TemporaryMemory(MemoryBase):
         Args:
             query (`Union[str, Embedding]`):
                 Query string or embedding.
-            metric (`Callable[[Embedding, Embedding], float]`):
+            metric (`Union[Literal["cos", "dot", "l2"], Callable[[Embedding, \
+                Embedding], float]]`):
                 A metric to compute the relevance between embeddings of query
-                and memory. In default, higher relevance means better match,
-                and you can set `reverse` to `True` to reverse the order.
+                and memory. If it's one of `"cos"`, `"dot"` and `"l2"`, the
+                relevance of all memory units is computed at once over the
+                embedding matrix maintained by the memory, where lower score
+                means better match for `"l2"` and higher is better for the
+                others. Memory units without embedding are skipped in this
+                case. If it's a callable object, it's called for each memory
+                unit and higher relevance means better match.
             top_k (`int`, defaults to `1`):
                 The number of memory units to retrieve.
             preserve_order (`bool`, defaults to `True`):
@@ -268,15 +312,38 @@ class TemporaryMemory(MemoryBase):
             `list[dict]`: a list of retrieved memory units in
             specific order.
         """
-
-        retrieved_items = retrieve_from_list(
-            query,
-            self.get_embeddings(embedding_model or self.embedding_model),
-            metric,
-            top_k,
-            self.embedding_model,
-            preserve_order,
-        ).content
+        embedding_model = embedding_model or self.embedding_model
+
+        if isinstance(metric, str):
+            # Embed the memory units without embeddings in place, and sync
+            # the embeddings that are set after the units are added
+            self.get_embeddings(embedding_model)
+
+            if isinstance(query, Msg):
+                query = getattr(query, "embedding", None)
+            elif isinstance(query, str):
+                if embedding_model is None:
+                    raise RuntimeError("Embedding model is not provided.")
+                query = embedding_model(query)
+
+            retrieved_items = [
+                (score, index, self._content[index])
+                for score, index in self._embedding_index.search(
+                    query,
+                    metric,
+                    top_k,
+                    preserve_order,
+                )
+            ]
+        else:
+            retrieved_items = retrieve_from_list(
+                query,
+                self.get_embeddings(embedding_model),
+                metric,
+                top_k,
+                self.embedding_model,
+                preserve_order,
+            ).content
 
         # obtain the corresponding memory item
         response = []
@@ -297,26 +364,97 @@ class TemporaryMemory(MemoryBase):
     ) -> list:
         """Get embeddings of all memory units. If `embedding_model` is
         provided, the memory units that doesn't have `embedding` attribute
-        will be embedded. Otherwise, its embedding will be `None`.
+        will be embedded in batches. Otherwise, its embedding will be `None`.
 
         Args:
             embedding_model
                 (`Callable[[Union[str, dict]], Embedding]`, defaults to
                 `None`):
-                Embedding model or embedding vector.
+                Embedding model, which takes a list of texts and returns
+                one embedding for each text.
 
         Returns:
             `list[Union[Embedding, None]]`: List of embeddings or None.
         """
+        if embedding_model is not None:
+            self._embed_units(0, embedding_model)
+
         embeddings = []
-        for memory_unit in self._content:
-            if memory_unit.embedding is None and embedding_model is not None:
-                # embedding
-                # TODO: embed only content or its string representation
-                memory_unit.embedding = embedding_model(memory_unit)
-            embeddings.append(memory_unit.embedding)
+        for index, memory_unit in enumerate(self._content):
+            embedding = getattr(memory_unit, "embedding", None)
+            if embedding is not None and not self._embedding_index.is_valid(
+                index,
+            ):
+                # the embedding is set after the unit is added
+                self._embedding_index.update(index, embedding)
+            embeddings.append(embedding)
         return embeddings
 
+    def _embed_units(
+        self,
+        start: int,
+        embedding_model: Callable[[list[str]], Any],
+    ) -> None:
+        """Embed the memory units from `start` that don't have embeddings
+        in batches of `self.embedding_batch_size`, so that the embedding model
+        is called once per batch rather than once per unit.
+
+        The failure of a batch is logged and only leaves the units in that
+        batch without embeddings, which will be embedded again next time.
+
+        Args:
+            start (`int`):
+                The position of the first memory unit to check.
+            embedding_model (`Callable[[list[str]], Any]`):
+                The embedding model, which takes a list of texts and returns
+                a `ModelResponse` (or a list) with one embedding per text.
+        """
+        indices = [
+            index
+            for index in range(start, len(self._content))
+            if getattr(self._content[index], "embedding", None) is None
+        ]
+        batches = [
+            indices[i : i + self.embedding_batch_size]
+            for i in range(0, len(indices), self.embedding_batch_size)
+        ]
+
+        def _embed_batch(batch: list[int]) -> Optional[list]:
+            # TODO: embed only content or its string representation
+            texts = [_convert_to_str(self._content[_].content) for _ in batch]
+            try:
+                response = embedding_model(texts)
+                embeddings = getattr(response, "embedding", response)
+                if embeddings is None or len(embeddings) != len(batch):
+                    raise ValueError(
+                        f"Expect {len(batch)} embeddings from the embedding "
+                        f"model, but got {embeddings}.",
+                    )
+                return list(embeddings)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to embed a batch of {len(batch)} memory units "
+                    f"due to {e}",
+                )
+                return None
+
+        if self.embedding_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.embedding_workers, len(batches)),
+            ) as executor:
+                results = list(executor.map(_embed_batch, batches))
+        else:
+            results = [_embed_batch(_) for _ in batches]
+
+        # Write back in the caller thread, so that the memory and the index
+        # are not modified concurrently
+        for batch, embeddings in zip(batches, results):
+            if embeddings is None:
+                continue
+            for index, embedding in zip(batch, embeddings):
+                self._content[index].embedding = embedding
+                self._embedding_index.update(index, embedding)
+
     def get_memory(
         self,
         recent_n: Optional[int] = None,
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 # mypy: disable-error-code="misc"
 """The base class for message unit"""
+import time
+from datetime import datetime
 from typing import (
     Any,
     Literal,
@@ -18,6 +20,28 @@ from ..utils.common import (
     _get_timestamp,
 )
 
+_VALID_ROLES = frozenset(["system", "user", "assistant"])
+
+# The content types that are always serializable, for which the
+# serializability check is skipped
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+# The last formatted timestamp as (second, formatted string). Since the
+# timestamp is in seconds, messages created in the same second share the
+# same formatted string.
+_last_timestamp: tuple = (None, None)
+
+
+def _format_timestamp(created_at: float) -> str:
+    """Format the creation time of a message into the timestamp string."""
+    global _last_timestamp
+    second = int(created_at)
+    last_second, formatted = _last_timestamp
+    if last_second != second:
+        formatted = _get_timestamp(time=datetime.fromtimestamp(second))
+        _last_timestamp = (second, formatted)
+    return formatted
+
 
 class Msg:
     """The message class for AgentScope, which is responsible for storing
@@ -30,8 +54,27 @@ class Msg:
     - url:          the url(s) refers to multimodal content
     - metadata:     some additional information
     - timestamp:    when the message is created
+
+    To keep the construction cheap, the id and the formatted timestamp are
+    generated when they are accessed for the first time, and the
+    serializability of non-primitive content is checked when the message
+    is serialized.
     """
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_content",
+        "_content_checked",
+        "_role",
+        "_url",
+        "_metadata",
+        "_timestamp",
+        "_created_at",
+        # allow setting additional attributes, e.g. `embedding`
+        "__dict__",
+    )
+
     __serialized_attrs: set = {
         "id",
         "name",
@@ -84,13 +127,23 @@ class Msg:
                 Whether to print the message when initializing the message obj.
         """
 
-        self.id = uuid4().hex
-        self.name = name
-        self.content = content
-        self.role = role
-        self.url = url
-        self.metadata = metadata
-        self.timestamp = _get_timestamp()
+        if role not in _VALID_ROLES:
+            raise ValueError(
+                f"Invalid role {role}. The role must be one of "
+                f"['system', 'user', 'assistant']",
+            )
+
+        # Assign the slots directly rather than through the property
+        # setters, and defer the id and timestamp formatting
+        self._id = None
+        self._name = name
+        self._content = content
+        self._content_checked = isinstance(content, _PRIMITIVE_TYPES)
+        self._role = role
+        self._url = url
+        self._metadata = metadata
+        self._timestamp = None
+        self._created_at = time.time()
 
         if kwargs:
             logger.warning(
@@ -102,6 +155,20 @@ class Msg:
         if echo:
             logger.chat(self)
 
+    def __getstate__(self) -> dict:
+        """Return the state of the slots and the additional attributes for
+        pickling. The id and timestamp are generated before, so that the
+        copies share the same ones with the original message."""
+        _, _ = self.id, self.timestamp
+        state = {name: getattr(self, name) for name in self.__slots__[:-1]}
+        state.update(self.__dict__)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the state from pickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __getitem__(self, item: str) -> Any:
         """The getitem function, which will be deprecated in the new version"""
         logger.warning(
@@ -115,6 +182,8 @@ class Msg:
     @property
     def id(self) -> str:
         """The identity of the message."""
+        if self._id is None:
+            self._id = uuid4().hex
         return self._id
 
     @property
@@ -153,6 +222,8 @@ class Msg:
     @property
     def timestamp(self) -> str:
         """The timestamp when the message is created."""
+        if self._timestamp is None:
+            self._timestamp = _format_timestamp(self._created_at)
         return self._timestamp
 
     @id.setter  # type: ignore[no-redef]
@@ -167,19 +238,16 @@ class Msg:
 
     @content.setter  # type: ignore[no-redef]
     def content(self, value: Any) -> None:
-        """Set the content of the message."""
-        if not is_serializable(value):
-            logger.warning(
-                f"The content of {type(value)} is not serializable, which "
-                f"may cause problems.",
-            )
+        """Set the content of the message. The serializability of
+        non-primitive content is checked when the message is serialized."""
         self._content = value
+        self._content_checked = isinstance(value, _PRIMITIVE_TYPES)
 
     @role.setter  # type: ignore[no-redef]
     def role(self, value: Literal["system", "user", "assistant"]) -> None:
         """Set the role of the message sender. The role must be one of
         'system', 'user', 'assistant'."""
-        if value not in ["system", "user", "assistant"]:
+        if value not in _VALID_ROLES:
             raise ValueError(
                 f"Invalid role {value}. The role must be one of "
                 f"['system', 'user', 'assistant']",
@@ -229,6 +297,8 @@ class Msg:
         return "\n".join(colored_strs)
 
     def __eq__(self, value: object) -> bool:
+        if value is self:
+            return True
         return (
             isinstance(value, Msg)
             and self.id == value.id
@@ -247,16 +317,26 @@ class Msg:
         Returns:
             `dict`: The serialized dictionary.
         """
-        serialized_dict = {
+        if not self._content_checked:
+            if not is_serializable(self._content):
+                logger.warning(
+                    f"The content of {type(self._content)} is not "
+                    f"serializable, which may cause problems.",
+                )
+            self._content_checked = True
+
+        return {
             "__module__": self.__class__.__module__,
             "__name__": self.__class__.__name__,
+            "id": self.id,
+            "name": self._name,
+            "content": self._content,
+            "role": self._role,
+            "url": self._url,
+            "metadata": self._metadata,
+            "timestamp": self.timestamp,
         }
 
-        for attr_name in self.__serialized_attrs:
-            serialized_dict[attr_name] = getattr(self, f"_{attr_name}")
-
-        return serialized_dict
-
     @classmethod
     def from_dict(cls, serialized_dict: dict) -> "Msg":
         """Deserialize the dictionary to a Msg object.
@@ -5,7 +5,15 @@ from __future__ import annotations
 import inspect
 import time
 from functools import wraps
-from typing import Sequence, Any, Callable, Union, List, Optional
+from typing import (
+    Sequence,
+    Any,
+    Callable,
+    Generator,
+    Union,
+    List,
+    Optional,
+)
 
 from loguru import logger
 
@@ -14,6 +22,7 @@ from ..exception import ResponseParsingError
 
 from ..manager import FileManager
 from ..manager import MonitorManager
+from ..manager._monitor import _ModelCallStats
 from ..message import Msg
 from ..utils.common import _get_timestamp, _convert_to_str
 from ..constants import _DEFAULT_MAX_RETRIES
@@ -71,6 +80,7 @@ def _response_parse_decorator(
                 return parse_func(response)
             except ResponseParsingError as e:
                 if itr < max_retries:
+                    self.monitor.update_retries()
                     logger.warning(
                         f"Fail to parse response ({itr}/{max_retries}):\n"
                         f"{response}.\n"
@@ -87,6 +97,70 @@ def _response_parse_decorator(
     return checking_wrapper
 
 
+def _monitor_model_call(model_call: Callable) -> Callable:
+    """A decorator to record the latency, the time to first token (for
+    streaming responses), the throughput, the errors and the retries of the
+    model call into the monitor. For streaming responses, the call is
+    regarded as finished when the stream is exhausted."""
+
+    @wraps(model_call)
+    def monitoring_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        monitor = getattr(self, "monitor", None)
+        # Skip the nested calls, e.g. `super().__call__` in subclasses
+        if (
+            monitor is None
+            or not monitor.use_monitor
+            or _ModelCallStats.current() is not None
+        ):
+            return model_call(self, *args, **kwargs)
+
+        stats = _ModelCallStats(self.model_name)
+        try:
+            with stats.activate():
+                response = model_call(self, *args, **kwargs)
+        except Exception:
+            stats.finish(monitor, success=False)
+            raise
+
+        # pylint: disable=protected-access
+        if (
+            isinstance(response, ModelResponse)
+            and response._stream is not None
+        ):
+            response._stream = _monitor_stream(
+                response._stream,
+                stats,
+                monitor,
+            )
+        else:
+            stats.finish(monitor, success=True)
+        return response
+
+    return monitoring_wrapper
+
+
+def _monitor_stream(
+    stream: Generator,
+    stats: _ModelCallStats,
+    monitor: MonitorManager,
+) -> Generator:
+    """Wrap the stream of a model response to record the time to the first
+    chunk, and finish the call statistics when the stream ends."""
+    success = False
+    try:
+        while True:
+            with stats.activate():
+                try:
+                    chunk = next(stream)
+                except StopIteration:
+                    break
+            stats.first_token()
+            yield chunk
+        success = True
+    finally:
+        stats.finish(monitor, success=success)
+
+
 class ModelWrapperBase:
     """The base class for model wrapper."""
 
@@ -132,6 +206,12 @@ class ModelWrapperBase:
 
         logger.debug(f"Initialize model by configuration [{config_name}]")
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Monitor the `__call__` function of the subclasses."""
+        super().__init_subclass__(**kwargs)
+        if "__call__" in cls.__dict__:
+            cls.__call__ = _monitor_model_call(cls.__call__)
+
     def __call__(self, *args: Any, **kwargs: Any) -> ModelResponse:
         """Processing input with the model."""
         raise NotImplementedError(
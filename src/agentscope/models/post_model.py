@@ -148,6 +148,7 @@ class PostAPIModelWrapperBase(ModelWrapperBase, ABC):
                 break
 
             if i < self.max_retries:
+                self.monitor.update_retries()
                 logger.warning(
                     f"Failed to call the model with "
                     f"requests.codes == {response.status_code}, retry "
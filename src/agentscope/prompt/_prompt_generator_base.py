@@ -210,27 +210,27 @@ class SystemPromptGeneratorBase(ABC):
 
     def _generate_embeddings(self) -> List:
         """Generate embeddings for the examples."""
-        example_embeddings = []
-        for example in tqdm(self.example_list, desc="Generating embeddings"):
-            user_prompt = example["user_prompt"]
-
-            # Load cached embedding instead of generating them again
-            file_manager = FileManager.get_instance()
-            cached_embedding = file_manager.fetch_cached_text_embedding(
-                text=user_prompt,
-                embedding_model=self.embed_model_name,
-            )
-            if cached_embedding is None:
-                new_embedding = self.embed_model(user_prompt).embedding[0]
-                example_embeddings.append(new_embedding)
-                # Cache the embedding
-                file_manager.cache_text_embedding(
-                    text=user_prompt,
-                    embedding=new_embedding,
-                    embedding_model=self.embed_model_name,
-                )
-            else:
-                example_embeddings.append(cached_embedding)
+        user_prompts = [_["user_prompt"] for _ in self.example_list]
+
+        # Load cached embeddings in batch instead of generating them again
+        file_manager = FileManager.get_instance()
+        example_embeddings = file_manager.fetch_cached_text_embeddings(
+            texts=user_prompts,
+            embedding_model=self.embed_model_name,
+        )
+
+        missing = [i for i, _ in enumerate(example_embeddings) if _ is None]
+        for i in tqdm(missing, desc="Generating embeddings"):
+            example_embeddings[i] = self.embed_model(
+                user_prompts[i],
+            ).embedding[0]
+
+        # Cache the new embeddings
+        file_manager.cache_text_embeddings(
+            texts=[user_prompts[_] for _ in missing],
+            embeddings=[example_embeddings[_] for _ in missing],
+            embedding_model=self.embed_model_name,
+        )
         return example_embeddings
 
     def generate(self, user_input: str) -> str:
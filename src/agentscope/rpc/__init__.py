@@ -1,16 +1,18 @@
 # -*- coding: utf-8 -*-
 """Import all rpc related modules in the package."""
-from .rpc_client import RpcClient
+from .rpc_client import RpcClient, AsyncRpcClient
 from .rpc_meta import async_func, sync_func, RpcMeta
 from .rpc_config import DistConf
 from .rpc_async import AsyncResult
-from .rpc_object import RpcObject
+from .rpc_object import RpcObject, batch_call
 
 
 __all__ = [
     "RpcMeta",
     "RpcClient",
+    "AsyncRpcClient",
     "RpcObject",
+    "batch_call",
     "async_func",
     "sync_func",
     "AsyncResult",
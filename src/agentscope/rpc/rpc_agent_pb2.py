@@ -17,7 +17,7 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0frpc_agent.proto\x1a\x1bgoogle/protobuf/empty.proto".\n\x0fGeneralResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"Z\n\x12\x43reateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x17\n\x0f\x61gent_init_args\x18\x02 \x01(\x0c\x12\x19\n\x11\x61gent_source_code\x18\x03 \x01(\x0c"/\n\x0b\x41gentStatus\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t"+\n\x18UpdatePlaceholderRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\x03"\x1a\n\tStringMsg\x12\r\n\x05value\x18\x01 \x01(\t"\x17\n\x07\x42yteMsg\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c"G\n\x0f\x43\x61llFuncRequest\x12\x13\n\x0btarget_func\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\x10\n\x08\x61gent_id\x18\x03 \x01(\t">\n\x10\x43\x61llFuncResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\x0f\n\x07message\x18\x03 \x01(\t2\xe0\x05\n\x08RpcAgent\x12\x36\n\x08is_alive\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12\x32\n\x04stop\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12\x37\n\x0c\x63reate_agent\x12\x13.CreateAgentRequest\x1a\x10.GeneralResponse"\x00\x12.\n\x0c\x64\x65lete_agent\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12?\n\x11\x64\x65lete_all_agents\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12-\n\x0b\x63lone_agent\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12<\n\x0eget_agent_list\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12=\n\x0fget_server_info\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12\x33\n\x11set_model_configs\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12\x32\n\x10get_agent_memory\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12\x38\n\x0f\x63\x61ll_agent_func\x12\x10.CallFuncRequest\x1a\x11.CallFuncResponse"\x00\x12\x44\n\x12update_placeholder\x12\x19.UpdatePlaceholderRequest\x1a\x11.CallFuncResponse"\x00\x12)\n\rdownload_file\x12\n.StringMsg\x1a\x08.ByteMsg"\x00\x30\x01\x62\x06proto3',
+    b'\n\x0frpc_agent.proto\x1a\x1bgoogle/protobuf/empty.proto".\n\x0fGeneralResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t"Z\n\x12\x43reateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x17\n\x0f\x61gent_init_args\x18\x02 \x01(\x0c\x12\x19\n\x11\x61gent_source_code\x18\x03 \x01(\x0c"/\n\x0b\x41gentStatus\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t"+\n\x18UpdatePlaceholderRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\x03"$\n\x10SubscribeRequest\x12\x10\n\x08task_ids\x18\x01 \x03(\x03"I\n\nTaskResult\x12\x0f\n\x07task_id\x18\x01 \x01(\x03\x12\n\n\x02ok\x18\x02 \x01(\x08\x12\r\n\x05value\x18\x03 \x01(\x0c\x12\x0f\n\x07message\x18\x04 \x01(\t"\x1a\n\tStringMsg\x12\r\n\x05value\x18\x01 \x01(\t"\x17\n\x07\x42yteMsg\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c"G\n\x0f\x43\x61llFuncRequest\x12\x13\n\x0btarget_func\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\x10\n\x08\x61gent_id\x18\x03 \x01(\t">\n\x10\x43\x61llFuncResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\x0f\n\x07message\x18\x03 \x01(\t"6\n\x10\x43\x61llFuncsRequest\x12"\n\x08requests\x18\x01 \x03(\x0b\x32\x10.CallFuncRequest"9\n\x11\x43\x61llFuncsResponse\x12$\n\tresponses\x18\x01 \x03(\x0b\x32\x11.CallFuncResponse2\xd8\x06\n\x08RpcAgent\x12\x36\n\x08is_alive\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12\x32\n\x04stop\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12\x37\n\x0c\x63reate_agent\x12\x13.CreateAgentRequest\x1a\x10.GeneralResponse"\x00\x12.\n\x0c\x64\x65lete_agent\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12?\n\x11\x64\x65lete_all_agents\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12-\n\x0b\x63lone_agent\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12<\n\x0eget_agent_list\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12=\n\x0fget_server_info\x12\x16.google.protobuf.Empty\x1a\x10.GeneralResponse"\x00\x12\x33\n\x11set_model_configs\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12\x32\n\x10get_agent_memory\x12\n.StringMsg\x1a\x10.GeneralResponse"\x00\x12\x38\n\x0f\x63\x61ll_agent_func\x12\x10.CallFuncRequest\x1a\x11.CallFuncResponse"\x00\x12;\n\x10\x63\x61ll_agent_funcs\x12\x11.CallFuncsRequest\x1a\x12.CallFuncsResponse"\x00\x12\x44\n\x12update_placeholder\x12\x19.UpdatePlaceholderRequest\x1a\x11.CallFuncResponse"\x00\x12\x39\n\x11subscribe_results\x12\x11.SubscribeRequest\x1a\x0b.TaskResult"\x00(\x01\x30\x01\x12)\n\rdownload_file\x12\n.StringMsg\x1a\x08.ByteMsg"\x00\x30\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -33,14 +33,22 @@ if _descriptor._USE_C_DESCRIPTORS == False:
     _globals["_AGENTSTATUS"]._serialized_end = 235
     _globals["_UPDATEPLACEHOLDERREQUEST"]._serialized_start = 237
     _globals["_UPDATEPLACEHOLDERREQUEST"]._serialized_end = 280
-    _globals["_STRINGMSG"]._serialized_start = 282
-    _globals["_STRINGMSG"]._serialized_end = 308
-    _globals["_BYTEMSG"]._serialized_start = 310
-    _globals["_BYTEMSG"]._serialized_end = 333
-    _globals["_CALLFUNCREQUEST"]._serialized_start = 335
-    _globals["_CALLFUNCREQUEST"]._serialized_end = 406
-    _globals["_CALLFUNCRESPONSE"]._serialized_start = 408
-    _globals["_CALLFUNCRESPONSE"]._serialized_end = 470
-    _globals["_RPCAGENT"]._serialized_start = 473
-    _globals["_RPCAGENT"]._serialized_end = 1209
+    _globals["_SUBSCRIBEREQUEST"]._serialized_start = 282
+    _globals["_SUBSCRIBEREQUEST"]._serialized_end = 318
+    _globals["_TASKRESULT"]._serialized_start = 320
+    _globals["_TASKRESULT"]._serialized_end = 393
+    _globals["_STRINGMSG"]._serialized_start = 395
+    _globals["_STRINGMSG"]._serialized_end = 421
+    _globals["_BYTEMSG"]._serialized_start = 423
+    _globals["_BYTEMSG"]._serialized_end = 446
+    _globals["_CALLFUNCREQUEST"]._serialized_start = 448
+    _globals["_CALLFUNCREQUEST"]._serialized_end = 519
+    _globals["_CALLFUNCRESPONSE"]._serialized_start = 521
+    _globals["_CALLFUNCRESPONSE"]._serialized_end = 583
+    _globals["_CALLFUNCSREQUEST"]._serialized_start = 585
+    _globals["_CALLFUNCSREQUEST"]._serialized_end = 639
+    _globals["_CALLFUNCSRESPONSE"]._serialized_start = 641
+    _globals["_CALLFUNCSRESPONSE"]._serialized_end = 698
+    _globals["_RPCAGENT"]._serialized_start = 701
+    _globals["_RPCAGENT"]._serialized_end = 1557
 # @@protoc_insertion_point(module_scope)
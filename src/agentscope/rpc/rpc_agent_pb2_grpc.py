@@ -16,7 +16,9 @@ import agentscope.rpc.rpc_agent_pb2 as rpc__agent__pb2
 
 
 class RpcAgentStub(object):
-    """Servicer for rpc agent server"""
+    """TODO: rename to RpcServicer
+    Servicer for rpc agent server
+    """
 
     def __init__(self, channel):
         """Constructor.
@@ -79,11 +81,21 @@ class RpcAgentStub(object):
             request_serializer=rpc__agent__pb2.CallFuncRequest.SerializeToString,
             response_deserializer=rpc__agent__pb2.CallFuncResponse.FromString,
         )
+        self.call_agent_funcs = channel.unary_unary(
+            "/RpcAgent/call_agent_funcs",
+            request_serializer=rpc__agent__pb2.CallFuncsRequest.SerializeToString,
+            response_deserializer=rpc__agent__pb2.CallFuncsResponse.FromString,
+        )
         self.update_placeholder = channel.unary_unary(
             "/RpcAgent/update_placeholder",
             request_serializer=rpc__agent__pb2.UpdatePlaceholderRequest.SerializeToString,
             response_deserializer=rpc__agent__pb2.CallFuncResponse.FromString,
         )
+        self.subscribe_results = channel.stream_stream(
+            "/RpcAgent/subscribe_results",
+            request_serializer=rpc__agent__pb2.SubscribeRequest.SerializeToString,
+            response_deserializer=rpc__agent__pb2.TaskResult.FromString,
+        )
         self.download_file = channel.unary_stream(
             "/RpcAgent/download_file",
             request_serializer=rpc__agent__pb2.StringMsg.SerializeToString,
@@ -92,7 +104,9 @@ class RpcAgentStub(object):
 
 
 class RpcAgentServicer(object):
-    """Servicer for rpc agent server"""
+    """TODO: rename to RpcServicer
+    Servicer for rpc agent server
+    """
 
     def is_alive(self, request, context):
         """check server is alive"""
@@ -107,13 +121,17 @@ class RpcAgentServicer(object):
         raise NotImplementedError("Method not implemented!")
 
     def create_agent(self, request, context):
-        """create a new agent on the server"""
+        """TODO: rename to create_object
+        create a new object on the server
+        """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
     def delete_agent(self, request, context):
-        """delete agent from the server"""
+        """TODO: rename to delete_object
+        delete agent from the server
+        """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
@@ -125,7 +143,9 @@ class RpcAgentServicer(object):
         raise NotImplementedError("Method not implemented!")
 
     def clone_agent(self, request, context):
-        """clone an agent with specific agent_id"""
+        """TODO: remove this function
+        clone an agent with specific agent_id
+        """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
@@ -155,13 +175,31 @@ class RpcAgentServicer(object):
         raise NotImplementedError("Method not implemented!")
 
     def call_agent_func(self, request, context):
-        """call funcs of agent running on the server"""
+        """TODO: rename to call_object_func
+        call funcs of agent running on the server
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def call_agent_funcs(self, request, context):
+        """call funcs of many agents running on the server in a single request"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
     def update_placeholder(self, request, context):
-        """update value of PlaceholderMessage"""
+        """TODO: rename to update_async_result
+        update value of PlaceholderMessage
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def subscribe_results(self, request_iterator, context):
+        """subscribe the results of async calls, which are pushed by the server
+        once they are finished
+        """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
@@ -230,11 +268,21 @@ def add_RpcAgentServicer_to_server(servicer, server):
             request_deserializer=rpc__agent__pb2.CallFuncRequest.FromString,
             response_serializer=rpc__agent__pb2.CallFuncResponse.SerializeToString,
         ),
+        "call_agent_funcs": grpc.unary_unary_rpc_method_handler(
+            servicer.call_agent_funcs,
+            request_deserializer=rpc__agent__pb2.CallFuncsRequest.FromString,
+            response_serializer=rpc__agent__pb2.CallFuncsResponse.SerializeToString,
+        ),
         "update_placeholder": grpc.unary_unary_rpc_method_handler(
             servicer.update_placeholder,
             request_deserializer=rpc__agent__pb2.UpdatePlaceholderRequest.FromString,
             response_serializer=rpc__agent__pb2.CallFuncResponse.SerializeToString,
         ),
+        "subscribe_results": grpc.stream_stream_rpc_method_handler(
+            servicer.subscribe_results,
+            request_deserializer=rpc__agent__pb2.SubscribeRequest.FromString,
+            response_serializer=rpc__agent__pb2.TaskResult.SerializeToString,
+        ),
         "download_file": grpc.unary_stream_rpc_method_handler(
             servicer.download_file,
             request_deserializer=rpc__agent__pb2.StringMsg.FromString,
@@ -242,15 +290,16 @@ def add_RpcAgentServicer_to_server(servicer, server):
         ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-        "RpcAgent",
-        rpc_method_handlers,
+        "RpcAgent", rpc_method_handlers
     )
     server.add_generic_rpc_handlers((generic_handler,))
 
 
 # This class is part of an EXPERIMENTAL API.
 class RpcAgent(object):
-    """Servicer for rpc agent server"""
+    """TODO: rename to RpcServicer
+    Servicer for rpc agent server
+    """
 
     @staticmethod
     def is_alive(
@@ -571,6 +620,35 @@ class RpcAgent(object):
             metadata,
         )
 
+    @staticmethod
+    def call_agent_funcs(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/RpcAgent/call_agent_funcs",
+            rpc__agent__pb2.CallFuncsRequest.SerializeToString,
+            rpc__agent__pb2.CallFuncsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def update_placeholder(
         request,
@@ -600,6 +678,35 @@ class RpcAgent(object):
             metadata,
         )
 
+    @staticmethod
+    def subscribe_results(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            "/RpcAgent/subscribe_results",
+            rpc__agent__pb2.SubscribeRequest.SerializeToString,
+            rpc__agent__pb2.TaskResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def download_file(
         request,
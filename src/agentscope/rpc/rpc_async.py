@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Async related modules."""
-from typing import Any
+import asyncio
+from typing import Any, Generator
 from concurrent.futures import Future
 from loguru import logger
 
@@ -12,13 +13,21 @@ except ImportError as import_error:
     pickle = ImportErrorReporter(import_error, "distribtue")
 
 from ..message import Msg
-from .rpc_client import RpcClient
+from .rpc_client import RpcClient, AsyncRpcClient
 from ..utils.common import _is_web_url
 from .retry_strategy import RetryBase, _DEAFULT_RETRY_STRATEGY
 
 
 class AsyncResult:
-    """Use this class to get the the async result from rpc server."""
+    """Use this class to get the the async result from rpc server.
+
+    The result can be fetched synchronously by `result()` or by accessing
+    its attributes, or awaited in coroutines, e.g.
+
+    .. code-block:: python
+
+        msgs = await asyncio.gather(*[agent(msg) for agent in agents])
+    """
 
     def __init__(
         self,
@@ -39,6 +48,8 @@ class AsyncResult:
             self._stub = stub
         self._ready = False
         self._data = None
+        # The future of the subscribed result, see `batch_call`
+        self._subscription: Future = None
 
     def _fetch_result(
         self,
@@ -47,9 +58,10 @@ class AsyncResult:
         if self._task_id is None:
             self._task_id = self._get_task_id()
         self._data = pickle.loads(
-            RpcClient(self._host, self._port).update_result(
+            RpcClient(self._host, self._port).wait_result(
                 self._task_id,
                 retry=self._retry,
+                future=self._subscription,
             ),
         )
         # NOTE: its a hack here to download files
@@ -57,6 +69,37 @@ class AsyncResult:
         self._check_and_download_files()
         self._ready = True
 
+    async def _fetch_result_async(self) -> Any:
+        """Fetch result from the server without blocking the event loop."""
+        if not self._ready:
+            if self._task_id is None:
+                try:
+                    self._task_id = await asyncio.wrap_future(self._stub)
+                except Exception as e:
+                    logger.error(f"Failed to get task_id: {e}")
+                    raise ValueError(f"Failed to get task_id: {e}") from e
+            value = await AsyncRpcClient(
+                self._host,
+                self._port,
+            ).wait_result(
+                self._task_id,
+                retry=self._retry,
+                future=self._subscription,
+            )
+            data = pickle.loads(value)
+            if not self._ready:
+                self._data = data
+                # Download the files in a thread to avoid blocking the loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    self._check_and_download_files,
+                )
+                self._ready = True
+        return self._data
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._fetch_result_async().__await__()
+
     def update_value(self) -> None:
         """Update the value. For compatibility with old version."""
         self._fetch_result()
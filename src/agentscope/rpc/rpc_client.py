@@ -1,10 +1,21 @@
 # -*- coding: utf-8 -*-
 """ Client of rpc agent server """
 
+import asyncio
+import functools
 import json
 import os
-from typing import Optional, Sequence, Union, Generator, Any
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import (
+    Optional,
+    Sequence,
+    Union,
+    Generator,
+    Any,
+    Callable,
+    Coroutine,
+)
+from concurrent.futures import Future
 from loguru import logger
 
 from ..message import Msg
@@ -32,10 +43,10 @@ from ..manager import FileManager
 
 
 class RpcClient:
-    """A client of Rpc agent server"""
+    """A client of Rpc agent server. The agent calls are sync wrappers of
+    the ones in `AsyncRpcClient`."""
 
     _CHANNEL_POOL = {}
-    _EXECUTOR = ThreadPoolExecutor(max_workers=32)
 
     def __init__(
         self,
@@ -53,6 +64,7 @@ class RpcClient:
         self.host = host
         self.port = port
         self.url = f"{host}:{port}"
+        self._async_client = AsyncRpcClient(host, port)
 
     @classmethod
     def _get_channel(cls, url: str) -> Any:
@@ -83,29 +95,39 @@ class RpcClient:
         Returns:
             bytes: serialized return data.
         """
-        try:
-            stub = RpcAgentStub(RpcClient._get_channel(self.url))
-            result_msg = stub.call_agent_func(
-                agent_pb2.CallFuncRequest(
-                    target_func=func_name,
-                    value=value,
-                    agent_id=agent_id,
-                ),
+        return AsyncRpcClient.run_sync(
+            self._async_client.call_agent_func(
+                func_name=func_name,
+                agent_id=agent_id,
+                value=value,
                 timeout=timeout,
-            )
-            return result_msg.value
-        except Exception as e:
-            if not self.is_alive():
-                raise AgentServerNotAliveError(
-                    host=self.host,
-                    port=self.port,
-                    message=str(e),
-                ) from e
-            raise AgentCallError(
-                host=self.host,
-                port=self.port,
-                message=str(e),
-            ) from e
+            ),
+        )
+
+    def call_agent_funcs(
+        self,
+        calls: Sequence[tuple[str, str, Optional[bytes]]],
+        timeout: int = 300,
+    ) -> list[bytes]:
+        """Call the functions of many agents running on the server in a
+        single request.
+
+        Args:
+            calls (`Sequence[tuple[str, str, Optional[bytes]]]`):
+                The (func_name, agent_id, value) of each call.
+            timeout (`int`, optional): The timeout for the RPC call in seconds.
+            Defaults to 300.
+
+        Returns:
+            list[bytes]: serialized return data of each call.
+
+        Raises:
+            `AgentCallError`: If any of the calls fails. Note the other calls
+            are still processed by the server.
+        """
+        return AsyncRpcClient.run_sync(
+            self._async_client.call_agent_funcs(calls, timeout=timeout),
+        )
 
     def is_alive(self) -> bool:
         """Check if the agent server is alive.
@@ -168,28 +190,9 @@ class RpcClient:
         Returns:
             bool: Indicate whether the creation is successful
         """
-        try:
-            stub = RpcAgentStub(RpcClient._get_channel(self.url))
-            status = stub.create_agent(
-                agent_pb2.CreateAgentRequest(
-                    agent_id=agent_id,
-                    agent_init_args=pickle.dumps(agent_configs),
-                ),
-            )
-            if not status.ok:
-                logger.error(
-                    f"Error when creating agent: {status.message}",
-                )
-            return status.ok
-        except Exception as e:
-            # check the server and raise a more reasonable error
-            if not self.is_alive():
-                raise AgentServerNotAliveError(
-                    host=self.host,
-                    port=self.port,
-                    message=str(e),
-                ) from e
-            raise AgentCreationError(host=self.host, port=self.port) from e
+        return AsyncRpcClient.run_sync(
+            self._async_client.create_agent(agent_configs, agent_id),
+        )
 
     def delete_agent(
         self,
@@ -204,13 +207,9 @@ class RpcClient:
         Returns:
             bool: Indicate whether the deletion is successful
         """
-        stub = RpcAgentStub(RpcClient._get_channel(self.url))
-        status = stub.delete_agent(
-            agent_pb2.StringMsg(value=agent_id),
+        return AsyncRpcClient.run_sync(
+            self._async_client.delete_agent(agent_id),
         )
-        if not status.ok:
-            logger.error(f"Error when deleting agent: {status.message}")
-        return status.ok
 
     def delete_all_agent(self) -> bool:
         """Delete all agents on the server."""
@@ -258,6 +257,53 @@ class RpcClient:
             )
         return resp.value
 
+    def subscribe_results(self, task_ids: Sequence[int]) -> list[Future]:
+        """Subscribe the results of async calls, which are pushed by the
+        server once they are finished.
+
+        Args:
+            task_ids (`Sequence[int]`): The `task_id` of the async results.
+
+        Returns:
+            `list[Future]`: The futures resolved with the serialized values.
+        """
+        return AsyncRpcClient.run_sync(
+            self._async_client.subscribe_results(task_ids),
+        )
+
+    def wait_result(
+        self,
+        task_id: int,
+        retry: RetryBase = _DEAFULT_RETRY_STRATEGY,
+        future: Optional[Future] = None,
+    ) -> bytes:
+        """Wait for the value of the async result pushed by the server. If
+        the subscription stream is not available, e.g. the server is in an
+        old version, fall back to polling by `update_result`.
+
+        Args:
+            task_id (`int`): `task_id` of the async result.
+            retry (`RetryBase`): Retry strategy for the polling fallback.
+            future (`Optional[Future]`, defaults to `None`):
+                The future returned by `subscribe_results` if the result has
+                been subscribed.
+
+        Returns:
+            bytes: Serialized value.
+        """
+        try:
+            if future is None:
+                future = self.subscribe_results([task_id])[0]
+            return future.result()
+        except AgentCallError:
+            raise
+        except Exception as e:
+            logger.debug(
+                f"Fail to subscribe the result of task[{task_id}] from "
+                f"[{self.url}], fall back to polling: {e}",
+            )
+            return self.update_result(task_id, retry=retry)
+
     def get_agent_list(self) -> Sequence[dict]:
         """
         Get the summary of all agents on the server as a list.
@@ -346,6 +392,497 @@ class RpcClient:
         )
 
 
+class _AsyncResultSubscriber:
+    """Subscribe the results of async calls from an agent server through a
+    single bidirectional stream, where the server pushes the results once
+    they are finished. The stream is opened on demand and reopened after
+    failures.
+
+    Note it should be used in the event loop of `AsyncRpcClient`, while the
+    returned futures can be waited in any thread or event loop.
+    """
+
+    def __init__(self, host: str, port: int, channel: Any) -> None:
+        self.host = host
+        self.port = port
+        self._channel = channel
+        self._futures: dict[int, Future] = {}
+        self._call = None
+        self._receiving: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+
+    async def _receive(self, call: Any) -> None:
+        """Receive the pushed results and resolve the futures."""
+        error = None
+        try:
+            async for result in call:
+                future = self._futures.pop(result.task_id, None)
+                if future is None or future.done():
+                    continue
+                if result.ok:
+                    future.set_result(result.value)
+                else:
+                    future.set_exception(
+                        AgentCallError(
+                            host=self.host,
+                            port=self.port,
+                            message=f"Failed to update placeholder: "
+                            f"{result.message}",
+                        ),
+                    )
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            error = e
+
+        # Fail the pending futures, and reopen the stream for new ones
+        if self._call is call:
+            self._call = None
+        pending = self._futures
+        self._futures = {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(
+                    error
+                    or RuntimeError("The subscription stream is closed."),
+                )
+
+    async def subscribe(self, task_ids: Sequence[int]) -> list[Future]:
+        """Subscribe the results of the given tasks.
+
+        Args:
+            task_ids (`Sequence[int]`): The ids of the tasks.
+
+        Returns:
+            `list[Future]`: The futures resolved with the serialized results
+            in the same order as the task ids.
+        """
+        if self._call is None:
+            self._call = RpcAgentStub(self._channel).subscribe_results()
+            self._receiving = asyncio.get_running_loop().create_task(
+                self._receive(self._call),
+            )
+        call = self._call
+
+        futures = []
+        new_ids = []
+        for task_id in task_ids:
+            if task_id not in self._futures:
+                self._futures[task_id] = Future()
+                new_ids.append(task_id)
+            futures.append(self._futures[task_id])
+
+        if len(new_ids) > 0:
+            try:
+                async with self._write_lock:
+                    await call.write(
+                        agent_pb2.SubscribeRequest(task_ids=new_ids),
+                    )
+            except Exception as e:
+                for task_id in new_ids:
+                    future = self._futures.pop(task_id, None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+        return futures
+
+    async def close(self) -> None:
+        """Close the subscription stream, and the pending futures will fail
+        with `RuntimeError`."""
+        if self._call is not None:
+            self._call.cancel()
+        if self._receiving is not None:
+            await asyncio.gather(self._receiving, return_exceptions=True)
+
+
+def _on_rpc_loop(func: Callable) -> Callable:
+    """Run the decorated coroutine function of `AsyncRpcClient` in the
+    event loop where the `grpc.aio` channels live, so that it can be
+    awaited in any event loop."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        loop = AsyncRpcClient.get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await func(*args, **kwargs)
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(func(*args, **kwargs), loop),
+        )
+
+    return wrapper
+
+
+class AsyncRpcClient:
+    """An asyncio client of Rpc agent server based on `grpc.aio`, so that
+    many concurrent calls can be awaited without occupying a thread for
+    each of them, e.g.
+
+    .. code-block:: python
+
+        msgs = await asyncio.gather(*[agent(msg) for agent in agents])
+
+    All the channels live in a single event loop running in a background
+    thread, and the coroutines of this client can be awaited in any event
+    loop. `RpcClient` forwards its agent calls to this client.
+    """
+
+    _LOOP: Optional[asyncio.AbstractEventLoop] = None
+    _LOOP_THREAD: Optional[threading.Thread] = None
+    _LOOP_LOCK = threading.Lock()
+    _CHANNEL_POOL: dict[str, Any] = {}
+    _SUBSCRIBER_POOL: dict[str, _AsyncResultSubscriber] = {}
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+    ) -> None:
+        """Init an asyncio rpc agent client
+
+        Args:
+            host (`str`): The hostname of the rpc agent server which the
+            client is connected.
+            port (`int`): The port of the rpc agent server which the client
+            is connected.
+        """
+        self.host = host
+        self.port = port
+        self.url = f"{host}:{port}"
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Get the event loop of the channels, which is started in a
+        background thread on the first call."""
+        with cls._LOOP_LOCK:
+            if cls._LOOP is None:
+                cls._LOOP = asyncio.new_event_loop()
+                cls._LOOP_THREAD = threading.Thread(
+                    target=cls._LOOP.run_forever,
+                    name="agentscope-rpc-loop",
+                    daemon=True,
+                )
+                cls._LOOP_THREAD.start()
+            return cls._LOOP
+
+    @classmethod
+    def submit(cls, coro: Coroutine) -> Future:
+        """Run the coroutine in the event loop of the channels without
+        waiting for it.
+
+        Args:
+            coro (`Coroutine`): The coroutine to run.
+
+        Returns:
+            `Future`: The future of the result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, cls.get_loop())
+
+    @classmethod
+    def run_sync(cls, coro: Coroutine) -> Any:
+        """Run the coroutine in the event loop of the channels, and block
+        until it's finished."""
+        cls.get_loop()
+        if threading.current_thread() is cls._LOOP_THREAD:
+            coro.close()
+            raise RuntimeError(
+                "Can't block the event loop of the rpc channels, please "
+                "await the coroutine instead.",
+            )
+        return cls.submit(coro).result()
+
+    @classmethod
+    def close_channels(cls) -> None:
+        """Close all the channels and subscription streams.
+
+        Note:
+            `grpc.aio` is not fork-safe, so the channels should be closed
+            before forking new processes.
+        """
+        if cls._LOOP is not None:
+            cls.submit(cls._close_channels()).result()
+
+    @classmethod
+    async def _close_channels(cls) -> None:
+        subscribers = list(cls._SUBSCRIBER_POOL.values())
+        cls._SUBSCRIBER_POOL.clear()
+        for subscriber in subscribers:
+            await subscriber.close()
+        channels = list(cls._CHANNEL_POOL.values())
+        cls._CHANNEL_POOL.clear()
+        for channel in channels:
+            await channel.close()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        """The event loop thread doesn't exist in the child process, so
+        start over there."""
+        cls._LOOP = None
+        cls._LOOP_THREAD = None
+        cls._LOOP_LOCK = threading.Lock()
+        cls._CHANNEL_POOL = {}
+        cls._SUBSCRIBER_POOL = {}
+
+    def _get_channel(self) -> Any:
+        """Get the channel of the server, should be called in the event
+        loop of the channels."""
+        if self.url not in AsyncRpcClient._CHANNEL_POOL:
+            AsyncRpcClient._CHANNEL_POOL[self.url] = grpc.aio.insecure_channel(
+                self.url,
+                options=_DEFAULT_RPC_OPTIONS,
+            )
+        return AsyncRpcClient._CHANNEL_POOL[self.url]
+
+    def _get_stub(self) -> Any:
+        return RpcAgentStub(self._get_channel())
+
+    async def _raise_call_error(self, e: Exception) -> None:
+        """Raise a more reasonable error after a failed call."""
+        if not await self.is_alive():
+            raise AgentServerNotAliveError(
+                host=self.host,
+                port=self.port,
+                message=str(e),
+            ) from e
+        raise AgentCallError(
+            host=self.host,
+            port=self.port,
+            message=str(e),
+        ) from e
+
+    @_on_rpc_loop
+    async def call_agent_func(
+        self,
+        func_name: str,
+        agent_id: str,
+        value: Optional[bytes] = None,
+        timeout: int = 300,
+    ) -> bytes:
+        """Call the specific function of an agent running on the server.
+
+        Args:
+            func_name (`str`): The name of the function being called.
+            agent_id (`str`): The id of the agent.
+            value (`bytes`, optional): The serialized function input value.
+            Defaults to None.
+            timeout (`int`, optional): The timeout for the RPC call in seconds.
+            Defaults to 300.
+
+        Returns:
+            bytes: serialized return data.
+        """
+        try:
+            result_msg = await self._get_stub().call_agent_func(
+                agent_pb2.CallFuncRequest(
+                    target_func=func_name,
+                    value=value,
+                    agent_id=agent_id,
+                ),
+                timeout=timeout,
+            )
+        except Exception as e:
+            await self._raise_call_error(e)
+        return result_msg.value
+
+    @_on_rpc_loop
+    async def call_agent_funcs(
+        self,
+        calls: Sequence[tuple[str, str, Optional[bytes]]],
+        timeout: int = 300,
+    ) -> list[bytes]:
+        """Call the functions of many agents running on the server in a
+        single request.
+
+        Args:
+            calls (`Sequence[tuple[str, str, Optional[bytes]]]`):
+                The (func_name, agent_id, value) of each call.
+            timeout (`int`, optional): The timeout for the RPC call in seconds.
+            Defaults to 300.
+
+        Returns:
+            list[bytes]: serialized return data of each call.
+
+        Raises:
+            `AgentCallError`: If any of the calls fails. Note the other calls
+            are still processed by the server.
+        """
+        try:
+            resp = await self._get_stub().call_agent_funcs(
+                agent_pb2.CallFuncsRequest(
+                    requests=[
+                        agent_pb2.CallFuncRequest(
+                            target_func=func_name,
+                            value=value,
+                            agent_id=agent_id,
+                        )
+                        for func_name, agent_id, value in calls
+                    ],
+                ),
+                timeout=timeout,
+            )
+        except Exception as e:
+            await self._raise_call_error(e)
+
+        errors = [_.message for _ in resp.responses if not _.ok]
+        if len(errors) > 0:
+            raise AgentCallError(
+                host=self.host,
+                port=self.port,
+                message="\n".join(errors),
+            )
+        return [_.value for _ in resp.responses]
+
+    @_on_rpc_loop
+    async def is_alive(self) -> bool:
+        """Check if the agent server is alive.
+
+        Returns:
+            bool: Indicate whether the server is alive.
+        """
+        try:
+            status = await self._get_stub().is_alive(Empty(), timeout=5)
+            if not status.ok:
+                logger.info(
+                    f"Agent Server [{self.host}:{self.port}] not alive.",
+                )
+            return status.ok
+        except Exception as e:
+            logger.info(
+                f"Error when calling is_alive: {str(e)}",
+            )
+            return False
+
+    @_on_rpc_loop
+    async def create_agent(
+        self,
+        agent_configs: dict,
+        agent_id: str = None,
+    ) -> bool:
+        """Create a new agent for this client.
+
+        Args:
+            agent_configs (`dict`): Init configs of the agent, generated by
+                `RpcMeta`.
+            agent_id (`str`): agent_id of the created agent.
+
+        Returns:
+            bool: Indicate whether the creation is successful
+        """
+        try:
+            status = await self._get_stub().create_agent(
+                agent_pb2.CreateAgentRequest(
+                    agent_id=agent_id,
+                    agent_init_args=pickle.dumps(agent_configs),
+                ),
+            )
+        except Exception as e:
+            # check the server and raise a more reasonable error
+            if not await self.is_alive():
+                raise AgentServerNotAliveError(
+                    host=self.host,
+                    port=self.port,
+                    message=str(e),
+                ) from e
+            raise AgentCreationError(host=self.host, port=self.port) from e
+        if not status.ok:
+            logger.error(
+                f"Error when creating agent: {status.message}",
+            )
+        return status.ok
+
+    @_on_rpc_loop
+    async def delete_agent(
+        self,
+        agent_id: str = None,
+    ) -> bool:
+        """Delete agents with the specific agent_id.
+
+        Args:
+            agent_id (`str`): id of the agent to be deleted.
+
+        Returns:
+            bool: Indicate whether the deletion is successful
+        """
+        status = await self._get_stub().delete_agent(
+            agent_pb2.StringMsg(value=agent_id),
+        )
+        if not status.ok:
+            logger.error(f"Error when deleting agent: {status.message}")
+        return status.ok
+
+    @_on_rpc_loop
+    async def subscribe_results(self, task_ids: Sequence[int]) -> list[Future]:
+        """Subscribe the results of async calls, which are pushed by the
+        server once they are finished.
+
+        Args:
+            task_ids (`Sequence[int]`): The `task_id` of the async results.
+
+        Returns:
+            `list[Future]`: The futures resolved with the serialized values,
+            which can be awaited by `asyncio.wrap_future`.
+        """
+        if self.url not in AsyncRpcClient._SUBSCRIBER_POOL:
+            AsyncRpcClient._SUBSCRIBER_POOL[self.url] = _AsyncResultSubscriber(
+                self.host,
+                self.port,
+                self._get_channel(),
+            )
+        return await AsyncRpcClient._SUBSCRIBER_POOL[self.url].subscribe(
+            task_ids,
+        )
+
+    async def wait_result(
+        self,
+        task_id: int,
+        retry: RetryBase = _DEAFULT_RETRY_STRATEGY,
+        future: Optional[Future] = None,
+    ) -> bytes:
+        """Wait for the value of the async result pushed by the server, and
+        fall back to polling if the subscription stream is not available,
+        see `RpcClient.wait_result`.
+
+        Args:
+            task_id (`int`): `task_id` of the async result.
+            retry (`RetryBase`): Retry strategy for the polling fallback.
+            future (`Optional[Future]`, defaults to `None`):
+                The future returned by `subscribe_results` if the result has
+                been subscribed.
+
+        Returns:
+            bytes: Serialized value.
+        """
+        try:
+            if future is None:
+                future = (await self.subscribe_results([task_id]))[0]
+            return await asyncio.wrap_future(future)
+        except AgentCallError:
+            raise
+        except Exception as e:
+            logger.debug(
+                f"Fail to subscribe the result of task[{task_id}] from "
+                f"[{self.url}], fall back to polling: {e}",
+            )
+        # The retry strategy blocks, so poll in the default executor
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                RpcClient(self.host, self.port).update_result,
+                task_id,
+                retry=retry,
+            ),
+        )
+
+    def __reduce__(self) -> tuple:
+        return (
+            AsyncRpcClient,
+            (self.host, self.port),
+        )
+
+
+os.register_at_fork(
+    after_in_child=AsyncRpcClient._reset_after_fork,  # pylint: disable=W0212
+)
+
+
 class RpcAgentClient(RpcClient):
     """`RpcAgentClient` has renamed to `RpcClient`.
     This class is kept for backward compatibility, please use `RpcClient`
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """A proxy object which represent a object located in a rpc server."""
 from __future__ import annotations
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Sequence, Union
 from abc import ABC
 from inspect import getmembers, isfunction
 from types import FunctionType
 from concurrent.futures import ThreadPoolExecutor, Future
+import asyncio
 import threading
 
 try:
@@ -15,7 +16,7 @@ except ImportError as e:
 
     pickle = ImportErrorReporter(e, "distribute")
 
-from .rpc_client import RpcClient
+from .rpc_client import RpcClient, AsyncRpcClient
 from .rpc_async import AsyncResult
 from .retry_strategy import RetryBase, _DEAFULT_RETRY_STRATEGY
 from ..exception import AgentCreationError, AgentServerNotAliveError
@@ -178,10 +179,11 @@ class RpcObject(ABC):
 
     def create(self, configs: dict) -> None:
         """create the object on the rpc server."""
-        self._creating_stub = _call_func_in_thread(
-            self.client.create_agent,
-            configs,
-            self._oid,
+        self._creating_stub = AsyncRpcClient.submit(
+            AsyncRpcClient(self.host, self.port).create_agent(
+                configs,
+                self._oid,
+            ),
         )
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
@@ -237,15 +239,28 @@ class RpcObject(ABC):
             ),
         )
 
+    async def _call_func_async(self, func_name: str, args: dict) -> Any:
+        """Call a function in rpc server by the asyncio client."""
+        return pickle.loads(
+            await AsyncRpcClient(self.host, self.port).call_agent_func(
+                agent_id=self._oid,
+                func_name=func_name,
+                value=pickle.dumps(args),
+            ),
+        )
+
     def _async_func(self, name: str) -> Callable:
         def async_wrapper(*args, **kwargs) -> Any:  # type: ignore[no-untyped-def]
+            # The call is sent in the event loop of the asyncio client, so
+            # no thread is occupied for each call
             return AsyncResult(
                 host=self.host,
                 port=self.port,
-                stub=_call_func_in_thread(
-                    self._call_func,
-                    func_name=name,
-                    args={"args": args, "kwargs": kwargs},
+                stub=AsyncRpcClient.submit(
+                    self._call_func_async(
+                        func_name=name,
+                        args={"args": args, "kwargs": kwargs},
+                    ),
                 ),
                 retry=self.retry_strategy,
             )
@@ -309,3 +324,116 @@ class RpcObject(ABC):
                 True,
             ),
         )
+
+
+def batch_call(
+    objs: Sequence[RpcObject],
+    func_name: str = "__call__",
+    args_list: Optional[Sequence[tuple]] = None,
+    kwargs_list: Optional[Sequence[dict]] = None,
+) -> list:
+    """Call the same function of many rpc objects with one request per
+    server, instead of one request per object. The calls are grouped by
+    the (host, port) of the objects, and the servers are requested
+    concurrently.
+
+    For async functions (e.g. `__call__` and `reply` of agents), the
+    returned `AsyncResult` objects are subscribed together, so they are
+    resolved as soon as the server pushes the results.
+
+    Example:
+
+    .. code-block:: python
+
+        msgs = batch_call(participants, "__call__", [(msg,)] * len(participants))
+        values = [int(_.content) for _ in msgs]
+
+    Args:
+        objs (`Sequence[RpcObject]`):
+            The rpc objects to call.
+        func_name (`str`, defaults to `"__call__"`):
+            The name of the function.
+        args_list (`Optional[Sequence[tuple]]`, defaults to `None`):
+            The positional arguments of each call.
+        kwargs_list (`Optional[Sequence[dict]]`, defaults to `None`):
+            The keyword arguments of each call.
+
+    Returns:
+        `list`: The results in the same order as the objects, which are
+        `AsyncResult` for async functions and the returned values for the
+        others.
+    """
+    if args_list is None:
+        args_list = [()] * len(objs)
+    if kwargs_list is None:
+        kwargs_list = [{}] * len(objs)
+    if not len(objs) == len(args_list) == len(kwargs_list):
+        raise ValueError(
+            "The numbers of objects, args and kwargs should be the same.",
+        )
+
+    # Group the calls by the server
+    groups: dict[tuple[str, int], list[int]] = {}
+    for i, obj in enumerate(objs):
+        obj._check_created()  # pylint: disable=W0212
+        groups.setdefault((obj.host, obj.port), []).append(i)
+
+    # Serialize the arguments before entering the event loop of the client
+    payloads = [
+        pickle.dumps({"args": args, "kwargs": kwargs})
+        for args, kwargs in zip(args_list, kwargs_list)
+    ]
+
+    async def _call_server(
+        host: str,
+        port: int,
+        indices: list[int],
+    ) -> tuple[list[bytes], list]:
+        client = AsyncRpcClient(host, port)
+        values = await client.call_agent_funcs(
+            [
+                (func_name, objs[i]._oid, payloads[i])  # pylint: disable=W0212
+                for i in indices
+            ],
+        )
+        # Subscribe all the async results of this server at once
+        futures: list = [None] * len(values)
+        async_pos = [
+            k
+            for k, i in enumerate(indices)
+            if func_name
+            in objs[i]._cls._info.async_func  # pylint: disable=W0212
+        ]
+        if len(async_pos) > 0:
+            subscribed = await client.subscribe_results(
+                [pickle.loads(values[k]) for k in async_pos],
+            )
+            for k, future in zip(async_pos, subscribed):
+                futures[k] = future
+        return values, futures
+
+    async def _call_servers() -> list:
+        return await asyncio.gather(
+            *[
+                _call_server(host, port, indices)
+                for (host, port), indices in groups.items()
+            ],
+        )
+
+    results: list = [None] * len(objs)
+    for ((host, port), indices), (values, futures) in zip(
+        groups.items(),
+        AsyncRpcClient.run_sync(_call_servers()),
+    ):
+        for i, value, future in zip(indices, values, futures):
+            if future is None:
+                results[i] = pickle.loads(value)
+            else:
+                results[i] = AsyncResult(
+                    host=host,
+                    port=port,
+                    task_id=pickle.loads(value),
+                    retry=objs[i].retry_strategy,
+                )
+                results[i]._subscription = future  # pylint: disable=W0212
+    return results
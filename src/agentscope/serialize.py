@@ -2,17 +2,59 @@
 """The serialization module for the package."""
 import importlib
 import json
-from typing import Any
+from typing import Any, Callable, Optional, Union
+
+try:
+    import msgpack
+except ImportError as import_error:
+    from agentscope.utils.common import ImportErrorReporter
+
+    msgpack = ImportErrorReporter(import_error, "distribute")
+
+_MSG_MODULE = "agentscope.message.msg"
+_MSG_NAME = "Msg"
+
+# The msgpack extension type code of `Msg` object, and the order of its
+# fields in the extension data
+_MSG_EXT_CODE = 1
+_MSG_FIELDS = ("id", "name", "content", "role", "url", "metadata", "timestamp")
+
+_class_cache: dict[tuple[str, str], Any] = {}
+"""The classes looked up by the deserialize hook, keyed by (module name,
+class name), to avoid importing the module for every object."""
+
+_serializers: dict[
+    str,
+    tuple[Callable[[Any], Union[str, bytes]], Callable[[Any], Any]],
+] = {}
+"""The registered serializers, mapping from the format name to a pair of
+serialize and deserialize functions."""
+
+
+def _is_msg(obj: Any) -> bool:
+    """Check if the object is a `Msg` object."""
+    # To avoid circular import, we hard code the module name here
+    return (
+        obj.__class__.__module__ == _MSG_MODULE
+        and obj.__class__.__name__ == _MSG_NAME
+    )
+
+
+def _get_class(module_name: str, class_name: str) -> Any:
+    """Get the class by its module and name, with the result cached."""
+    key = (module_name, class_name)
+    cls = _class_cache.get(key, None)
+    if cls is None:
+        module = importlib.import_module(module_name)
+        cls = getattr(module, class_name)
+        _class_cache[key] = cls
+    return cls
 
 
 def _default_serialize(obj: Any) -> Any:
     """Serialize the object when `json.dumps` cannot handle it."""
     if hasattr(obj, "__module__") and hasattr(obj, "__class__"):
-        # To avoid circular import, we hard code the module name here
-        if (
-            obj.__module__ == "agentscope.message.msg"
-            and obj.__class__.__name__ == "Msg"
-        ):
+        if _is_msg(obj):
             return obj.to_dict()
 
     return obj
@@ -25,29 +67,137 @@ def _deserialize_hook(data: dict) -> Any:
     class_name = data.get("__name__", None)
 
     if module_name is not None and class_name is not None:
-        module = importlib.import_module(module_name)
-        cls = getattr(module, class_name)
+        cls = _get_class(module_name, class_name)
         if hasattr(cls, "from_dict"):
             return cls.from_dict(data)
     return data
 
 
-def serialize(obj: Any) -> str:
-    """Serialize the object to a JSON string.
+def _serialize_json(obj: Any) -> str:
+    """Serialize the object to a JSON string."""
+    return json.dumps(obj, ensure_ascii=False, default=_default_serialize)
+
+
+def _deserialize_json(s: Union[str, bytes]) -> Any:
+    """Deserialize the JSON string to an object."""
+    return json.loads(s, object_hook=_deserialize_hook)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Pack the `Msg` object into a compact extension type, which stores
+    the fields in a fixed order without the keys."""
+    if _is_msg(obj):
+        serialized_dict = obj.to_dict()
+        return msgpack.ExtType(
+            _MSG_EXT_CODE,
+            msgpack.packb(
+                [serialized_dict[_] for _ in _MSG_FIELDS],
+                default=_msgpack_default,
+                use_bin_type=True,
+            ),
+        )
+    raise TypeError(f"Object of type {type(obj)} is not serializable.")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """Unpack the extension types."""
+    if code == _MSG_EXT_CODE:
+        fields = msgpack.unpackb(
+            data,
+            ext_hook=_msgpack_ext_hook,
+            object_hook=_deserialize_hook,
+            strict_map_key=False,
+        )
+        return _get_class(_MSG_MODULE, _MSG_NAME).from_dict(
+            {
+                "__module__": _MSG_MODULE,
+                "__name__": _MSG_NAME,
+                **dict(zip(_MSG_FIELDS, fields)),
+            },
+        )
+    return msgpack.ExtType(code, data)
+
+
+def _serialize_msgpack(obj: Any) -> bytes:
+    """Serialize the object into msgpack bytes."""
+    return msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+
+
+def _deserialize_msgpack(s: bytes) -> Any:
+    """Deserialize the msgpack bytes to an object."""
+    return msgpack.unpackb(
+        s,
+        ext_hook=_msgpack_ext_hook,
+        object_hook=_deserialize_hook,
+        strict_map_key=False,
+    )
+
+
+def register_serializer(
+    fmt: str,
+    serialize_func: Callable[[Any], Union[str, bytes]],
+    deserialize_func: Callable[[Any], Any],
+) -> None:
+    """Register a serialization format, which can be used by `serialize` and
+    `deserialize` with the `fmt` argument. If the format name is conflicting
+    with the existing one, the new functions will override it.
+
+    Args:
+        fmt (`str`):
+            The name of the format.
+        serialize_func (`Callable[[Any], Union[str, bytes]]`):
+            The function to serialize an object.
+        deserialize_func (`Callable[[Any], Any]`):
+            The function to deserialize the output of `serialize_func`.
+    """
+    _serializers[fmt] = (serialize_func, deserialize_func)
+
+
+def _get_serializer(
+    fmt: str,
+) -> tuple[Callable[[Any], Union[str, bytes]], Callable[[Any], Any]]:
+    """Get the serialize and deserialize functions of the format."""
+    if fmt not in _serializers:
+        raise ValueError(
+            f"Unknown serialization format {fmt}, expect one of "
+            f"{list(_serializers.keys())}.",
+        )
+    return _serializers[fmt]
+
+
+def serialize(obj: Any, fmt: str = "json") -> Union[str, bytes]:
+    """Serialize the object to a JSON string, or into the given format.
 
     For AgentScope, this function supports to serialize `Msg` object for now.
+
+    Args:
+        obj (`Any`):
+            The object to serialize.
+        fmt (`str`, defaults to `"json"`):
+            The serialization format, e.g. `"json"` for a JSON string and
+            `"msgpack"` for compact binary bytes.
     """
     # TODO: We leave the serialization of agents in next PR
-    return json.dumps(obj, ensure_ascii=False, default=_default_serialize)
+    return _get_serializer(fmt)[0](obj)
 
 
-def deserialize(s: str) -> Any:
-    """Deserialize the JSON string to an object
+def deserialize(s: Union[str, bytes], fmt: Optional[str] = None) -> Any:
+    """Deserialize the JSON string, or the data in the given format, to an
+    object.
 
     For AgentScope, this function supports to serialize `Msg` object for now.
+
+    Args:
+        s (`Union[str, bytes]`):
+            The serialized data.
+        fmt (`Optional[str]`, defaults to `None`):
+            The serialization format. If not given, `"json"` is used for
+            strings and `"msgpack"` for bytes.
     """
     # TODO: We leave the serialization of agents in next PR
-    return json.loads(s, object_hook=_deserialize_hook)
+    if fmt is None:
+        fmt = "msgpack" if isinstance(s, (bytes, bytearray)) else "json"
+    return _get_serializer(fmt)[1](s)
 
 
 def is_serializable(obj: Any) -> bool:
@@ -57,3 +207,7 @@ def is_serializable(obj: Any) -> bool:
         return True
     except Exception:
         return False
+
+
+register_serializer("json", _serialize_json, _deserialize_json)
+register_serializer("msgpack", _serialize_msgpack, _deserialize_msgpack)
@@ -2,6 +2,7 @@
 """A pool used to store the async result."""
 import threading
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
 try:
     import redis
@@ -48,6 +49,37 @@ class AsyncResultPool(ABC):
             `TimeoutError`: When the timeout is reached.
         """
 
+    def add_done_callback(
+        self,
+        key: int,
+        callback: Callable[[int, Optional[bytes]], None],
+    ) -> None:
+        """Call the callback with the key and the value once the value is
+        set, or with `None` if the value is not found in the pool.
+
+        The default implementation waits for the value in a new thread,
+        subclasses should override it to avoid occupying threads.
+
+        Args:
+            key (`int`): The key of the value.
+            callback (`Callable[[int, Optional[bytes]], None]`):
+                The function to call.
+        """
+
+        def _wait() -> None:
+            while True:
+                try:
+                    value = self.get(key)
+                    break
+                except TimeoutError:
+                    continue
+                except Exception:
+                    value = None
+                    break
+            callback(key, value)
+
+        threading.Thread(target=_wait, daemon=True).start()
+
 
 class LocalPool(AsyncResultPool):
     """Local pool for storing results."""
@@ -59,6 +91,8 @@ class LocalPool(AsyncResultPool):
         )
         self.object_id_cnt = 0
         self.object_id_lock = threading.Lock()
+        self.callbacks: dict[int, list] = {}
+        self.callback_lock = threading.Lock()
 
     def _get_object_id(self) -> int:
         with self.object_id_lock:
@@ -75,6 +109,22 @@ class LocalPool(AsyncResultPool):
         self.pool[key] = value
         with cond:
             cond.notify_all()
+        with self.callback_lock:
+            callbacks = self.callbacks.pop(key, [])
+        for callback in callbacks:
+            callback(key, value)
+
+    def add_done_callback(
+        self,
+        key: int,
+        callback: Callable[[int, Optional[bytes]], None],
+    ) -> None:
+        with self.callback_lock:
+            value = self.pool.get(key)
+            if isinstance(value, threading.Condition):
+                self.callbacks.setdefault(key, []).append(callback)
+                return
+        callback(key, value)
 
     def get(self, key: int, timeout: int = 5) -> bytes:
         """Get the value with timeout"""
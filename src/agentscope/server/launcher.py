@@ -439,7 +439,7 @@ class RpcAgentServerLauncher:
     def _launch_in_sub(self) -> None:
         """Launch an agent server in sub-process."""
         from agentscope.manager import ASManager
-        from agentscope.rpc import RpcClient
+        from agentscope.rpc import RpcClient, AsyncRpcClient
 
         init_settings = ASManager.get_instance().state_dict()
         # gRPC channel should be closed before forking new process
@@ -450,6 +450,7 @@ class RpcAgentServerLauncher:
         ) in RpcClient._CHANNEL_POOL.items():  # pylint: disable=W0212
             channel.close()
         RpcClient._CHANNEL_POOL.clear()  # pylint: disable=W0212
+        AsyncRpcClient.close_channels()
 
         self.parent_con, child_con = Pipe()
         start_event = Event()
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """ Server of distributed agent"""
+import asyncio
 import os
 import threading
 import traceback
 import json
 from concurrent import futures
 from multiprocessing.synchronize import Event as EventClass
-from typing import Any
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
 from loguru import logger
 import requests
 
@@ -286,14 +287,40 @@ class AgentServerServicer(RpcAgentServicer):
         context: ServicerContext,
     ) -> agent_pb2.GeneralResponse:
         """Call the specific servicer function."""
+        response = self._call_func(request)
+        if not response.ok:
+            return context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                response.message,
+            )
+        return response
+
+    def call_agent_funcs(
+        self,
+        request: agent_pb2.CallFuncsRequest,
+        context: ServicerContext,
+    ) -> agent_pb2.CallFuncsResponse:
+        """Call the functions of many agents in a single request. The calls
+        are processed in order, and a failed call doesn't abort the others
+        but returns a response with `ok=False`."""
+        return agent_pb2.CallFuncsResponse(
+            responses=[self._call_func(_) for _ in request.requests],
+        )
+
+    def _call_func(
+        self,
+        request: agent_pb2.CallFuncRequest,
+    ) -> agent_pb2.CallFuncResponse:
+        """Call the function of an agent. For async functions, the call is
+        submitted to the executor and the response holds the task id."""
         agent_id = request.agent_id
         func_name = request.target_func
         raw_value = request.value
         agent = self.get_agent(request.agent_id)
         if agent is None:
-            return context.abort(
-                grpc.StatusCode.INVALID_ARGUMENT,
-                f"Agent [{request.agent_id}] not exists.",
+            return agent_pb2.CallFuncResponse(
+                ok=False,
+                message=f"Agent [{request.agent_id}] not exists.",
             )
         try:
             if (
@@ -333,7 +360,7 @@ class AgentServerServicer(RpcAgentServicer):
             trace = traceback.format_exc()
             error_msg = f"Agent[{agent_id}] error: {trace}"
             logger.error(error_msg)
-            return context.abort(grpc.StatusCode.INVALID_ARGUMENT, error_msg)
+            return agent_pb2.CallFuncResponse(ok=False, message=error_msg)
 
     def update_placeholder(
         self,
@@ -363,6 +390,72 @@ class AgentServerServicer(RpcAgentServicer):
                 value=result,
             )
 
+    async def subscribe_results(  # pylint: disable=W0236
+        self,
+        request_iterator: AsyncIterator[agent_pb2.SubscribeRequest],
+        context: ServicerContext,
+    ) -> AsyncGenerator[agent_pb2.TaskResult, None]:
+        """Push the results of the subscribed tasks to the client once they
+        are finished. The stream ends after the client stops subscribing and
+        all the subscribed results are pushed.
+
+        Note this handler runs on the event loop of the server rather than
+        in the thread pool, so that the long-lived streams don't occupy the
+        threads for agent calls.
+        """
+        loop = asyncio.get_running_loop()
+        results: asyncio.Queue = asyncio.Queue()
+        n_subscribed = 0
+        n_pushed = 0
+        finished = False
+
+        def _on_done(task_id: int, value: Optional[bytes]) -> None:
+            loop.call_soon_threadsafe(results.put_nowait, (task_id, value))
+
+        async def _read_requests() -> None:
+            nonlocal n_subscribed, finished
+            try:
+                async for request in request_iterator:
+                    for task_id in request.task_ids:
+                        n_subscribed += 1
+                        self.result_pool.add_done_callback(task_id, _on_done)
+            finally:
+                finished = True
+                # wake up the writer to check whether to end the stream
+                results.put_nowait(None)
+
+        reader = asyncio.create_task(_read_requests())
+        try:
+            while not (finished and n_pushed == n_subscribed):
+                item = await results.get()
+                if item is None:
+                    continue
+                task_id, value = item
+                n_pushed += 1
+                yield self._make_task_result(task_id, value)
+        finally:
+            reader.cancel()
+
+    @staticmethod
+    def _make_task_result(
+        task_id: int,
+        value: Optional[bytes],
+    ) -> agent_pb2.TaskResult:
+        """Wrap the value in the result pool into a `TaskResult`."""
+        if value is None:
+            return agent_pb2.TaskResult(
+                task_id=task_id,
+                ok=False,
+                message=f"Async result of task[{task_id}] not found.",
+            )
+        if value[:6] == MAGIC_PREFIX:
+            return agent_pb2.TaskResult(
+                task_id=task_id,
+                ok=False,
+                message=value[6:].decode("utf-8"),
+            )
+        return agent_pb2.TaskResult(task_id=task_id, ok=True, value=value)
+
     def get_agent_list(
         self,
         request: Empty,
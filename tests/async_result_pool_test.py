@@ -71,6 +71,26 @@ class BasicResultPoolTest(unittest.TestCase):
         pool = get_pool(pool_type="local", max_len=100, max_expire=3600)
         self._test_result_pool(pool)
 
+    def test_local_pool_callback(self) -> None:
+        """Test the callbacks of local pool"""
+        pool = get_pool(pool_type="local", max_len=100, max_expire=3600)
+        results = []
+
+        def _callback(key: int, value: bytes) -> None:
+            results.append((key, pickle.loads(value)))
+
+        oid1 = pool.prepare()
+        oid2 = pool.prepare()
+        pool.add_done_callback(oid1, _callback)
+        self.assertListEqual(results, [])
+        pool.set(oid1, pickle.dumps(1))
+        self.assertListEqual(results, [(oid1, 1)])
+
+        # the callback is called at once if the value is ready
+        pool.set(oid2, pickle.dumps(2))
+        pool.add_done_callback(oid2, _callback)
+        self.assertListEqual(results, [(oid1, 1), (oid2, 2)])
+
     @unittest.skip(reason="redis is not installed")
     def test_redis_pool(self) -> None:
         """Test Redis pool"""
@@ -4,8 +4,12 @@ import os
 import shutil
 from unittest import TestCase
 
+import numpy as np
+
 import agentscope
-from agentscope.manager import ASManager
+from agentscope.manager import ASManager, FileManager
+from agentscope.manager._embedding_cache import EmbeddingCache
+from agentscope.manager._file import _get_text_embedding_record_hash
 from agentscope.constants import _DEFAULT_CACHE_DIR
 from agentscope._version import __version__
 
@@ -128,3 +132,98 @@ class ManagerTest(TestCase):
         ASManager.get_instance().flush()
         # Remove the dir
         shutil.rmtree("./runs")
+
+
+class EmbeddingCacheTest(TestCase):
+    """Test cases for the embedding cache."""
+
+    def setUp(self) -> None:
+        """Init the cache dir."""
+        self.cache_dir = os.path.abspath("./test_embedding_cache")
+        agentscope.init(disable_saving=True)
+        self.file_manager = FileManager.get_instance()
+        self.file_manager.cache_dir = self.cache_dir
+
+    def test_batch_cache(self) -> None:
+        """Test caching and fetching embeddings in batch."""
+        self.file_manager.cache_text_embeddings(
+            ["a", "b"],
+            [[1.0, 2.0], [3.0, 4.0]],
+            "model",
+        )
+        self.file_manager.cache_text_embedding("c", [5.0, 6.0], "model")
+
+        embeddings = self.file_manager.fetch_cached_text_embeddings(
+            ["c", "a", "x", "b"],
+            "model",
+        )
+        self.assertListEqual(embeddings[0].tolist(), [5.0, 6.0])
+        self.assertListEqual(embeddings[1].tolist(), [1.0, 2.0])
+        self.assertIsNone(embeddings[2])
+        self.assertListEqual(embeddings[3].tolist(), [3.0, 4.0])
+
+        # the embeddings of other models are not shared
+        self.assertIsNone(
+            self.file_manager.fetch_cached_text_embedding("a", "other"),
+        )
+
+        # all embeddings are stored in a single database
+        files = os.listdir(self.file_manager.embedding_cache_dir)
+        self.assertIn("embedding_cache.db", files)
+        self.assertFalse(any(_.endswith(".npy") for _ in files))
+
+    def test_migration(self) -> None:
+        """Test migrating the embeddings cached as .npy files."""
+        record_hash = _get_text_embedding_record_hash("a", "model")
+        path = os.path.join(
+            self.file_manager.embedding_cache_dir,
+            f"{record_hash}.npy",
+        )
+        np.save(path, [1.0, 2.0])
+
+        embedding = self.file_manager.fetch_cached_text_embedding(
+            "a",
+            "model",
+        )
+        self.assertListEqual(embedding.tolist(), [1.0, 2.0])
+        self.assertFalse(os.path.exists(path))
+
+    def test_eviction(self) -> None:
+        """Test the least recently used embeddings are evicted."""
+        path = os.path.join(self.cache_dir, "cache.db")
+        # 4 float64 vectors with 2 dims
+        cache = EmbeddingCache(path, max_size=64, max_memory_items=1)
+
+        cache.put_many([(str(i), [i, i]) for i in range(4)])
+        self.assertEqual(len(cache), 4)
+        self.assertEqual(cache.total_size, 64)
+
+        # refresh the access time of "0"
+        self.assertListEqual(cache.get("0").tolist(), [0, 0])
+
+        cache.put("4", [4, 4])
+        self.assertEqual(len(cache), 4)
+        self.assertIsNone(cache.get("1"))
+        self.assertListEqual(cache.get("0").tolist(), [0, 0])
+
+        # replacing an entry doesn't count its old size
+        cache.put("4", [4.0, 4.0, 4.0, 4.0])
+        self.assertEqual(cache.total_size, 64)
+        self.assertEqual(len(cache), 3)
+
+        # the entries and their size are persisted across instances
+        cache.close()
+        cache = EmbeddingCache(path)
+        self.assertEqual(cache.total_size, 64)
+        self.assertListEqual(
+            [_ is None for _ in cache.get_many(["0", "1", "2", "3", "4"])],
+            [False, True, True, False, False],
+        )
+        cache.delete("4")
+        self.assertEqual(cache.total_size, 32)
+        cache.close()
+
+    def tearDown(self) -> None:
+        """Clean up the cache dir."""
+        ASManager.get_instance().flush()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
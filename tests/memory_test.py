@@ -4,11 +4,17 @@ Unit tests for memory classes and functions
 """
 
 import os
+import shutil
 import unittest
 from unittest.mock import patch, MagicMock
 
 from agentscope.message import Msg
-from agentscope.memory import TemporaryMemory
+from agentscope.memory import (
+    TemporaryMemory,
+    RingBufferMemory,
+    PersistentMemory,
+)
+from agentscope.models import ModelResponse
 from agentscope.serialize import serialize
 
 
@@ -58,6 +64,27 @@ class TemporaryMemoryTest(unittest.TestCase):
             [self.msg_1, self.msg_2, self.msg_3],
         )
 
+    def test_add_duplicate(self) -> None:
+        """Test the same message is only added once"""
+        self.memory.add([self.msg_1, self.msg_2, self.msg_1])
+        self.memory.add(self.msg_2)
+        self.assertEqual(
+            self.memory.get_memory(),
+            [self.msg_1, self.msg_2],
+        )
+
+        # deleted messages can be added again
+        self.memory.delete(0)
+        self.memory.add([self.msg_1, self.msg_3, self.msg_2])
+        self.assertEqual(
+            self.memory.get_memory(),
+            [self.msg_2, self.msg_1, self.msg_3],
+        )
+
+        self.memory.clear()
+        self.memory.load([self.msg_3, self.msg_3])
+        self.assertEqual(self.memory.get_memory(), [self.msg_3])
+
     @patch("loguru.logger.warning")
     def test_delete(self, mock_logging: MagicMock) -> None:
         """Test delete operations"""
@@ -115,6 +142,250 @@ class TemporaryMemoryTest(unittest.TestCase):
             serialize([user_input, agent_input]),
         )
 
+    def test_retrieve_by_embedding(self) -> None:
+        """Test the vectorized retrieval over the embedding matrix."""
+        self.msg_1.embedding = [1.0, 0.0]
+        self.msg_2.embedding = [0.6, 0.8]
+        self.msg_3.embedding = [0.0, 2.0]
+        self.memory.add([self.msg_1, self.msg_2, self.msg_3])
+
+        # cosine similarity, ordered by relevance
+        retrieved = self.memory.retrieve_by_embedding(
+            [0.0, 1.0],
+            metric="cos",
+            top_k=2,
+            preserve_order=False,
+        )
+        self.assertEqual([_["index"] for _ in retrieved], [2, 1])
+        self.assertAlmostEqual(retrieved[0]["score"], 1.0, places=5)
+        self.assertAlmostEqual(retrieved[1]["score"], 0.8, places=5)
+
+        # cosine similarity, ordered by index
+        retrieved = self.memory.retrieve_by_embedding(
+            [0.0, 1.0],
+            metric="cos",
+            top_k=2,
+        )
+        self.assertEqual([_["index"] for _ in retrieved], [1, 2])
+        self.assertEqual(retrieved[0]["memory"], self.msg_2)
+
+        # dot product takes the norm into account
+        retrieved = self.memory.retrieve_by_embedding(
+            [1.0, 1.0],
+            metric="dot",
+            top_k=1,
+        )
+        self.assertEqual(retrieved[0]["memory"], self.msg_3)
+        self.assertAlmostEqual(retrieved[0]["score"], 2.0, places=5)
+
+        # euclidean distance, lower is better
+        retrieved = self.memory.retrieve_by_embedding(
+            [1.0, 0.1],
+            metric="l2",
+            top_k=1,
+        )
+        self.assertEqual(retrieved[0]["memory"], self.msg_1)
+        self.assertAlmostEqual(retrieved[0]["score"], 0.1, places=5)
+
+        # the index keeps in sync after deletion
+        self.memory.delete(0)
+        retrieved = self.memory.retrieve_by_embedding(
+            [1.0, 0.0],
+            metric="cos",
+            top_k=3,
+            preserve_order=False,
+        )
+        self.assertEqual(
+            [_["memory"] for _ in retrieved],
+            [self.msg_2, self.msg_3],
+        )
+
+        # and after clearing
+        self.memory.clear()
+        self.assertEqual(
+            self.memory.retrieve_by_embedding([1.0, 0.0], metric="cos"),
+            [],
+        )
+
+    def test_batch_embedding(self) -> None:
+        """Test embedding memory units in batches."""
+        calls = []
+
+        def embedding_model(texts: list[str]) -> ModelResponse:
+            calls.append(texts)
+            if "fail" in texts:
+                raise RuntimeError("mock failure")
+            return ModelResponse(
+                embedding=[[float(len(_)), 1.0] for _ in texts],
+            )
+
+        memory = TemporaryMemory(
+            embedding_model=embedding_model,
+            embedding_batch_size=2,
+        )
+        msgs = [Msg("user", str(i) * (i + 1), role="user") for i in range(5)]
+        memory.add(msgs, embed=True)
+
+        # 5 units are embedded with 3 calls
+        self.assertEqual(len(calls), 3)
+        self.assertListEqual(
+            [_.embedding for _ in msgs],
+            [[float(i + 1), 1.0] for i in range(5)],
+        )
+
+        # units with embeddings are not embedded again
+        calls.clear()
+        memory.get_embeddings(embedding_model)
+        self.assertEqual(calls, [])
+
+        # the failure only affects the failed batch
+        memory = TemporaryMemory(
+            embedding_model=embedding_model,
+            embedding_batch_size=2,
+            embedding_workers=2,
+        )
+        msgs = [
+            Msg("user", "a", role="user"),
+            Msg("user", "fail", role="user"),
+            Msg("user", "bc", role="user"),
+        ]
+        memory.add(msgs)
+        embeddings = memory.get_embeddings(embedding_model)
+        self.assertListEqual(embeddings, [None, None, [2.0, 1.0]])
+
+
+class RingBufferMemoryTest(unittest.TestCase):
+    """
+    Test cases for RingBufferMemory
+    """
+
+    def setUp(self) -> None:
+        self.spill_file = "tmp_ring_buffer_spill.jsonl"
+        self.msgs = [Msg("user", "x" * (i + 1), role="user") for i in range(5)]
+
+    def tearDown(self) -> None:
+        """Clean up before & after tests."""
+        if os.path.exists(self.spill_file):
+            os.remove(self.spill_file)
+
+    def test_capacity(self) -> None:
+        """Test the oldest messages are evicted and spilled to disk."""
+        memory = RingBufferMemory(capacity=3, spill_file=self.spill_file)
+        memory.add(self.msgs[:2])
+        self.assertEqual(memory.get_memory(), self.msgs[:2])
+
+        memory.add(self.msgs[2:])
+        self.assertEqual(memory.size(), 3)
+        self.assertEqual(memory.get_memory(), self.msgs[2:])
+        self.assertEqual(memory.get_memory(recent_n=2), self.msgs[3:])
+        self.assertEqual(
+            serialize(memory.get_spilled_memory()),
+            serialize(self.msgs[:2]),
+        )
+
+        # delete across the wrap-around boundary of the buffer
+        memory.delete([0, 2])
+        self.assertEqual(memory.get_memory(), [self.msgs[3]])
+        memory.add(self.msgs[0])
+        self.assertEqual(memory.get_memory(), [self.msgs[3], self.msgs[0]])
+
+        memory.clear()
+        self.assertEqual(memory.get_memory(), [])
+
+    @patch("agentscope.memory.ring_buffer_memory.count")
+    def test_token_budget(self, mock_count: MagicMock) -> None:
+        """Test the oldest messages are evicted to fit in the budget."""
+        mock_count.side_effect = lambda _, messages: sum(
+            len(m["content"]) for m in messages
+        )
+        memory = RingBufferMemory(
+            capacity=10,
+            max_tokens=5,
+            token_counting_model="mock_ring_buffer_model",
+        )
+        # the messages have 1, 2, 3, 4, 5 tokens
+        memory.add(self.msgs)
+        self.assertEqual(memory.get_memory(), [self.msgs[4]])
+        self.assertEqual(memory.total_tokens, 5)
+
+        memory.clear()
+        memory.add(self.msgs[:3])
+        self.assertEqual(memory.get_memory(), self.msgs[1:3])
+        self.assertEqual(memory.total_tokens, 5)
+
+
+class PersistentMemoryTest(unittest.TestCase):
+    """
+    Test cases for PersistentMemory
+    """
+
+    def setUp(self) -> None:
+        self.log_dir = "tmp_persistent_memory"
+        self.msgs = [
+            Msg("user", f"message {i}", role="user") for i in range(6)
+        ]
+
+    def tearDown(self) -> None:
+        """Clean up before & after tests."""
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def test_add_and_recover(self) -> None:
+        """Test the messages are appended to segments and recovered."""
+        memory = PersistentMemory(self.log_dir, segment_size=300)
+        memory.add(self.msgs[:4])
+        memory.add([self.msgs[4], self.msgs[0]])
+        self.assertEqual(memory.size(), 5)
+        self.assertEqual(
+            serialize(memory.get_memory(recent_n=2)),
+            serialize(self.msgs[3:5]),
+        )
+
+        # small segment size rolls over to multiple segment files
+        self.assertGreater(len(os.listdir(self.log_dir)), 1)
+        memory.close()
+
+        recovered = PersistentMemory(self.log_dir, segment_size=300)
+        self.assertEqual(
+            serialize(recovered.get_memory()),
+            serialize(self.msgs[:5]),
+        )
+        recovered.add(self.msgs[5])
+        self.assertEqual(recovered.get_memory(recent_n=1), [self.msgs[5]])
+        recovered.close()
+
+    def test_delete_and_compact(self) -> None:
+        """Test deletion is persisted and the log is compacted."""
+        memory = PersistentMemory(self.log_dir, compact_ratio=0.9)
+        memory.add(self.msgs)
+        memory.delete([0, 2])
+        self.assertEqual(
+            serialize(memory.get_memory()),
+            serialize([self.msgs[1]] + self.msgs[3:]),
+        )
+        memory.close()
+
+        # the tombstones are applied when recovering
+        memory = PersistentMemory(self.log_dir, compact_ratio=0.9)
+        self.assertEqual(memory.size(), 4)
+
+        memory.compact()
+        self.assertEqual(
+            serialize(memory.get_memory()),
+            serialize([self.msgs[1]] + self.msgs[3:]),
+        )
+        memory.add(self.msgs[0])
+        memory.close()
+
+        memory = PersistentMemory(self.log_dir)
+        self.assertEqual(
+            serialize(memory.get_memory()),
+            serialize([self.msgs[1]] + self.msgs[3:] + [self.msgs[0]]),
+        )
+
+        memory.clear()
+        self.assertEqual(memory.get_memory(), [])
+        self.assertEqual(PersistentMemory(self.log_dir).size(), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 """The unit test for message module."""
 
+import copy
+import pickle
 import unittest
+from unittest.mock import patch, MagicMock
 
 from agentscope.message import Msg
 
@@ -42,3 +45,41 @@ class MessageTest(unittest.TestCase):
         self.assertEqual(msg.metadata, deserialized_msg.metadata)
         self.assertEqual(msg.url, deserialized_msg.url)
         self.assertEqual(msg.timestamp, deserialized_msg.timestamp)
+
+    @patch("loguru.logger.warning")
+    def test_lazy_attributes(self, mock_logging: MagicMock) -> None:
+        """Test the deferred id, timestamp and serializability check."""
+        msg = Msg(name="A", content="B", role="assistant")
+        # the id and timestamp are stable once generated
+        self.assertEqual(len(msg.id), 32)
+        self.assertEqual(msg.id, msg.id)
+        self.assertRegex(
+            msg.timestamp, r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$"
+        )
+        self.assertNotEqual(
+            msg.id,
+            Msg(name="A", content="B", role="assistant").id,
+        )
+
+        # additional attributes can still be attached
+        msg.embedding = [0.1, 0.2]
+        self.assertEqual(msg.embedding, [0.1, 0.2])
+
+        # the copies share the same id and timestamp
+        fresh = Msg(name="A", content="B", role="assistant")
+        self.assertEqual(copy.deepcopy(fresh), fresh)
+        self.assertEqual(copy.copy(fresh).id, fresh.id)
+
+        # the slotted message can be pickled for rpc
+        unpickled = pickle.loads(pickle.dumps(msg))
+        self.assertEqual(unpickled, msg)
+        self.assertEqual(unpickled.embedding, [0.1, 0.2])
+
+        with self.assertRaises(ValueError):
+            Msg(name="A", content="B", role="invalid")
+
+        # the serializability is checked when serializing
+        msg = Msg(name="A", content={"key": object()}, role="assistant")
+        mock_logging.assert_not_called()
+        msg.to_dict()
+        mock_logging.assert_called_once()
@@ -6,10 +6,45 @@ Unit tests for Monitor classes
 import unittest
 import os
 import shutil
+import time
 from pathlib import Path
+from typing import Any, Generator
+
+from sqlalchemy import text
 
 import agentscope
 from agentscope.manager import MonitorManager, ASManager
+from agentscope.constants import _DEFAULT_TABLE_NAME_FOR_CHAT_AND_EMBEDDING
+from agentscope.models import ModelWrapperBase, ModelResponse
+
+
+class DummyStreamModel(ModelWrapperBase):
+    """A dummy model wrapper that responds in stream."""
+
+    model_type = "dummy_stream"
+
+    def __call__(self, stream: bool = True, **kwargs: Any) -> ModelResponse:
+        if kwargs.get("fail", False):
+            raise RuntimeError("failed")
+
+        def generator() -> Generator[str, None, None]:
+            response = ""
+            for chunk in ["Hello", ", ", "world"]:
+                time.sleep(0.01)
+                response += chunk
+                yield response
+            self.monitor.update_text_and_embedding_tokens(
+                model_name=self.model_name,
+                prompt_tokens=3,
+                completion_tokens=3,
+            )
+
+        if stream:
+            return ModelResponse(stream=generator())
+        return ModelResponse(text="Hello, world")
+
+    def format(self, *args: Any) -> Any:
+        return args
 
 
 class MonitorManagerTest(unittest.TestCase):
@@ -90,6 +125,141 @@ class MonitorManagerTest(unittest.TestCase):
             },
         )
 
+    def test_write_behind(self) -> None:
+        """Test the usage records are buffered and written in batches."""
+        self.monitor.initialize(
+            use_monitor=True,
+            flush_batch_size=5,
+            flush_interval=60,
+        )
+
+        def _count_records() -> int:
+            with self.monitor.engine.connect() as connection:
+                return connection.execute(
+                    text(
+                        f"SELECT COUNT(*) FROM "
+                        f"{_DEFAULT_TABLE_NAME_FOR_CHAT_AND_EMBEDDING}",
+                    ),
+                ).scalar()
+
+        for _ in range(3):
+            self.monitor.update_text_and_embedding_tokens(
+                model_name="gpt-4",
+                prompt_tokens=1,
+                completion_tokens=2,
+            )
+        # the records are still in the buffer
+        self.assertEqual(_count_records(), 0)
+
+        # but the totals are exact
+        self.assertEqual(
+            self.monitor.show_text_and_embedding_tokens()[0]["times"],
+            3,
+        )
+        self.assertEqual(_count_records(), 3)
+
+        # a full buffer is written by the background thread
+        for _ in range(5):
+            self.monitor.update_text_and_embedding_tokens(
+                model_name="gpt-4",
+                prompt_tokens=1,
+                completion_tokens=2,
+            )
+        for _ in range(50):
+            if _count_records() == 8:
+                break
+            time.sleep(0.1)
+        self.assertEqual(_count_records(), 8)
+
+    def test_model_latency(self) -> None:
+        """Test the latency percentiles, errors and retries."""
+        for i in range(1, 101):
+            self.monitor.update_model_latency(
+                model_name="gpt-4",
+                latency=i / 10,
+                completion_tokens=10,
+                retries=1 if i % 10 == 0 else 0,
+            )
+        self.monitor.update_model_latency(
+            model_name="gpt-4",
+            latency=100,
+            success=False,
+        )
+
+        latency = self.monitor.show_model_latency()
+        self.assertEqual(len(latency), 1)
+        self.assertEqual(latency[0]["times"], 101)
+        self.assertEqual(latency[0]["errors"], 1)
+        self.assertEqual(latency[0]["retries"], 10)
+        self.assertAlmostEqual(latency[0]["p50_latency"], 5.0)
+        self.assertAlmostEqual(latency[0]["p95_latency"], 9.5)
+        self.assertAlmostEqual(latency[0]["p99_latency"], 9.9)
+        self.assertAlmostEqual(latency[0]["avg_latency"], 5.05)
+        self.assertAlmostEqual(latency[0]["tokens_per_second"], 1000 / 505)
+
+    def test_model_call(self) -> None:
+        """Test the model calls are recorded with the time to first
+        token."""
+        model = DummyStreamModel(config_name="dummy", model_name="dummy")
+
+        response = model()
+        self.assertEqual(
+            [_ for _, _ in response.stream][-1],
+            "Hello, world",
+        )
+        model(stream=False)
+        with self.assertRaises(RuntimeError):
+            model(fail=True)
+
+        latency = self.monitor.show_model_latency()[0]
+        self.assertEqual(latency["times"], 3)
+        self.assertEqual(latency["errors"], 1)
+        self.assertGreater(latency["avg_ttft"], 0)
+        self.assertGreater(latency["tokens_per_second"], 0)
+
+    def test_export_prometheus(self) -> None:
+        """Test exporting the metrics in Prometheus text format."""
+        self.monitor.update_text_and_embedding_tokens(
+            model_name="gpt-4",
+            prompt_tokens=1,
+            completion_tokens=2,
+        )
+        for latency in [0.2, 0.7, 3]:
+            self.monitor.update_model_latency(
+                model_name="gpt-4",
+                latency=latency,
+                ttft=0.1,
+            )
+
+        metrics = self.monitor.export_prometheus()
+        self.assertIn(
+            "# TYPE agentscope_model_latency_seconds histogram",
+            metrics,
+        )
+        self.assertIn(
+            'agentscope_model_latency_seconds_bucket{model_name="gpt-4",'
+            'le="0.5"} 1',
+            metrics,
+        )
+        self.assertIn(
+            'agentscope_model_latency_seconds_bucket{model_name="gpt-4",'
+            'le="+Inf"} 3',
+            metrics,
+        )
+        self.assertIn(
+            'agentscope_model_ttft_seconds_count{model_name="gpt-4"} 3',
+            metrics,
+        )
+        self.assertIn(
+            'agentscope_model_calls_total{model_name="gpt-4"} 3',
+            metrics,
+        )
+        self.assertIn(
+            'agentscope_model_tokens_total{model_name="gpt-4",'
+            'type="completion"} 2',
+            metrics,
+        )
+
     def tearDown(self) -> None:
         """Tear down the test environment."""
         ASManager.get_instance().flush()
@@ -22,7 +22,7 @@ from agentscope.rpc import AsyncResult, RpcObject, DistConf
 from agentscope.message import Msg
 from agentscope.msghub import msghub
 from agentscope.pipelines import sequentialpipeline
-from agentscope.rpc import RpcClient, async_func
+from agentscope.rpc import RpcClient, async_func, batch_call
 from agentscope.exception import (
     AgentCallError,
     QuotaExceededError,
@@ -309,6 +309,64 @@ class BasicRpcAgentTest(unittest.TestCase):
         msg = agent_a(msg_result)  # type: ignore[arg-type]
         self.assertEqual(msg.id, 1)
 
+    def test_subscribe_results(self) -> None:
+        """test the results are pushed by the server"""
+        agent_a = DemoRpcAgent(
+            name="a",
+            to_dist=True,
+        )
+        results = [
+            agent_a(Msg(name="System", content=i, role="system"))
+            for i in range(3)
+        ]
+        task_ids = [_._get_task_id() for _ in results]
+        futures = RpcClient(agent_a.host, agent_a.port).subscribe_results(
+            task_ids,
+        )
+        values = [pickle.loads(_.result(timeout=30)) for _ in futures]
+        self.assertListEqual([_.content for _ in values], [0, 1, 2])
+
+        # the results can still be fetched by the async results
+        self.assertListEqual([_.content for _ in results], [0, 1, 2])
+
+    def test_batch_call(self) -> None:
+        """test calling many agents in one request per server"""
+        launcher = RpcAgentServerLauncher(
+            host="localhost",
+            port=12010,
+            local_mode=False,
+            custom_agent_classes=[DemoRpcAgentAdd],
+        )
+        launcher.launch()
+        agents = [
+            DemoRpcAgentAdd(name=f"a{i}").to_dist(
+                host="localhost",
+                port=launcher.port,
+            )
+            for i in range(4)
+        ]
+        st = time.time()
+        results = batch_call(
+            agents,
+            args_list=[
+                (Msg(name="System", content={"value": i}, role="system"),)
+                for i in range(4)
+            ],
+        )
+        self.assertListEqual(
+            [_.content["value"] for _ in results],
+            [1, 2, 3, 4],
+        )
+        # the agents run concurrently
+        self.assertLess(time.time() - st, 3.5)
+
+        # attributes and sync functions are returned directly
+        self.assertListEqual(
+            batch_call(agents, "name"),
+            [f"a{i}" for i in range(4)],
+        )
+        launcher.shutdown()
+
     def test_connect_to_an_existing_rpc_server(self) -> None:
         """test connecting to an existing server"""
         from agentscope.utils.common import _find_available_port
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the asyncio rpc client
+"""
+import asyncio
+import threading
+import time
+import unittest
+from typing import Optional, Union, Sequence
+
+import agentscope
+from agentscope.agents import AgentBase
+from agentscope.manager import ASManager
+from agentscope.message import Msg
+from agentscope.rpc import AsyncRpcClient
+from agentscope.server import RpcAgentServerLauncher
+
+
+class DemoAsyncAddAgent(AgentBase):
+    """A demo Rpc agent for test usage"""
+
+    def reply(self, x: Optional[Union[Msg, Sequence[Msg]]] = None) -> Msg:
+        """add the value, wait 1s"""
+        x.content["value"] += 1
+        time.sleep(1)
+        return x
+
+
+class AsyncRpcClientTest(unittest.TestCase):
+    """Test cases for AsyncRpcClient and awaiting AsyncResult"""
+
+    def setUp(self) -> None:
+        """Init for AsyncRpcClientTest"""
+        agentscope.init(
+            project="test",
+            name="async_rpc_client",
+            save_dir="./.unittest_runs",
+            save_log=False,
+            save_code=False,
+            save_api_invoke=False,
+            use_monitor=False,
+        )
+
+    def tearDown(self) -> None:
+        ASManager.get_instance().flush()
+
+    def _launch(self) -> RpcAgentServerLauncher:
+        launcher = RpcAgentServerLauncher(
+            host="localhost",
+            port=None,
+            custom_agent_classes=[DemoAsyncAddAgent],
+        )
+        launcher.launch()
+        return launcher
+
+    def test_await_async_results(self) -> None:
+        """Test awaiting the async results on an event loop, and launching
+        servers after that."""
+        launcher = self._launch()
+        agents = [
+            DemoAsyncAddAgent(name=f"a{i}").to_dist(
+                host="localhost",
+                port=launcher.port,
+            )
+            for i in range(8)
+        ]
+        n_threads = threading.active_count()
+
+        async def _run() -> list:
+            client = AsyncRpcClient("localhost", launcher.port)
+            self.assertTrue(await client.is_alive())
+            return await asyncio.gather(
+                *[
+                    agent(
+                        Msg(name="System", content={"value": i}, role="system"),
+                    )
+                    for i, agent in enumerate(agents)
+                ],
+            )
+
+        st = time.time()
+        msgs = asyncio.run(_run())
+        self.assertLess(time.time() - st, 3.5)
+        self.assertListEqual(
+            [_.content["value"] for _ in msgs],
+            list(range(1, 9)),
+        )
+        # no thread is started for each call
+        self.assertLess(threading.active_count() - n_threads, 8)
+
+        # the servers launched after using the asyncio client work well
+        new_launcher = self._launch()
+        agent = DemoAsyncAddAgent(name="b").to_dist(
+            host="localhost",
+            port=new_launcher.port,
+        )
+        msg = agent(Msg(name="System", content={"value": 1}, role="system"))
+        self.assertEqual(msg.content["value"], 2)
+
+        async def _call_again() -> Msg:
+            return await agents[0](msg)
+
+        self.assertEqual(asyncio.run(_call_again()).content["value"], 3)
+        new_launcher.shutdown()
+        launcher.shutdown()
+
+    def test_sync_call_in_loop_thread(self) -> None:
+        """Test the sync call in the event loop of the client is refused
+        rather than blocking the loop forever."""
+
+        async def _call() -> None:
+            AsyncRpcClient.run_sync(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            AsyncRpcClient.run_sync(_call())
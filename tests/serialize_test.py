@@ -5,7 +5,7 @@ import json
 import unittest
 
 from agentscope.message import Msg
-from agentscope.serialize import serialize, deserialize
+from agentscope.serialize import serialize, deserialize, register_serializer
 
 
 class SerializationTest(unittest.TestCase):
@@ -75,3 +75,43 @@ class SerializationTest(unittest.TestCase):
                 },
             ],
         )
+
+    def test_msgpack_serialize(self) -> None:
+        """Test the binary serialization format."""
+        msg1 = Msg("A", {"text": "A", "scores": [1, 2.5]}, "assistant")
+        msg2 = Msg("B", "B", "user", url=["a.png"], metadata={"k": "v"})
+        msg3 = Msg("C", msg1, "assistant")
+        data = [msg1, {"nested": [msg2, None, True]}, msg3]
+
+        serialized = serialize(data, fmt="msgpack")
+        self.assertTrue(isinstance(serialized, bytes))
+        self.assertLess(len(serialized), len(serialize(data).encode()))
+
+        # the bytes are deserialized by msgpack by default
+        deserialized = deserialize(serialized)
+        self.assertEqual(deserialized[0], msg1)
+        self.assertEqual(deserialized[1]["nested"][0], msg2)
+        self.assertEqual(deserialized[1]["nested"][1:], [None, True])
+        self.assertEqual(deserialized[2].content, msg1)
+
+        # round-trip compatible with the JSON form
+        self.assertEqual(
+            serialize(deserialize(serialize(data))),
+            serialize(deserialized),
+        )
+
+    def test_register_serializer(self) -> None:
+        """Test registering a custom serialization format."""
+        register_serializer(
+            "json_bytes",
+            lambda obj: serialize(obj).encode("utf-8"),
+            lambda s: deserialize(s.decode("utf-8")),
+        )
+        msg = Msg("A", "A", "assistant")
+        self.assertEqual(
+            deserialize(serialize(msg, fmt="json_bytes"), fmt="json_bytes"),
+            msg,
+        )
+
+        with self.assertRaises(ValueError):
+            serialize(msg, fmt="unknown")